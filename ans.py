@@ -1,10 +1,22 @@
 import sys
 import os
 import json
+import collections
+import logging
+import math
+import operator
+import queue
 import threading
 import datetime
+import functools
+import hashlib
+import itertools
+from concurrent.futures import ThreadPoolExecutor, wait as _wait_futures
 import random
 import re
+import shutil
+import string
+import time
 from typing import TYPE_CHECKING
 import ollama
 from PyQt5 import QtWidgets, QtCore, QtGui
@@ -36,11 +48,459 @@ try:
 except ImportError:
     HAS_REPORTLAB = False
 
+# Optional fast JSON for progress tracking
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(data):
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _copy_file(src, dst):
+    """Copy src to dst inside the kernel where possible (copy_file_range), else via shutil."""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            # Unsupported on this filesystem pair - fall through to shutil
+            pass
+    shutil.copyfile(src, dst)
+
+
+# Sentinel queued by the stream reader thread when the LLM stream is exhausted
+_STREAM_END = object()
+
+# Minimum milliseconds between full-text display updates for timeline and section streams
+_UI_EMIT_INTERVAL_MS = 50
+
+# Logs tab batching: queued lines are appended together after this many ms, or at once past _LOG_FLUSH_LINES
+_LOG_FLUSH_INTERVAL_MS = 250
+_LOG_FLUSH_LINES = 32
+
+# Minimum seconds between streaming progress log lines (one per second keeps the log widget idle)
+_PROGRESS_LOG_INTERVAL = 1.0
+
+# Seconds between StagedFile flushes, bounding how much streamed output a crash can lose
+_STAGED_FLUSH_INTERVAL = 2.0
+
+# Seconds between abort checks while a stream is held by pause
+_PAUSE_POLL_INTERVAL = 0.25
+
+# Longest generate_world waits for an in-flight world prefetch before cancelling it
+_PREFETCH_WAIT_TIMEOUT = 300
+
+# Keep the model (and its prompt KV cache) loaded between pipeline stages
+_OLLAMA_KEEP_ALIVE = '30m'
+
+# Cached refinement responses older than this are regenerated
+_LLM_CACHE_TTL = 7 * 24 * 3600
+
+# Characters per synthetic chunk when replaying a cached response
+_LLM_CACHE_CHUNK = 64
+
+# Embedding model and cosine threshold for matching paraphrased refinement feedback
+_FEEDBACK_EMBED_MODEL = 'nomic-embed-text'
+_FEEDBACK_MATCH_THRESHOLD = 0.92
+
+# Most recent feedback embeddings kept per project, and per stage/content base key
+_FEEDBACK_INDEX_LIMIT = 64
+_FEEDBACK_BASE_LIMIT = 8
+
+
+def _replay_chunks(text):
+    """Return an Ollama-style chunk iterator over cached text, so streaming displays still animate."""
+    return iter([{'response': text[i:i + _LLM_CACHE_CHUNK]} for i in range(0, len(text), _LLM_CACHE_CHUNK)])
+
+
+def _make_token_extractor(chunk):
+    """Return a callable pulling the response token out of chunks shaped like this one."""
+    if isinstance(chunk, dict):
+        # chunk.get('response'): one C-level lookup, None instead of KeyError for non-token chunks
+        return operator.methodcaller('get', 'response')
+    # GenerateResponse always defines the response field
+    return operator.attrgetter('response')
+
+
+def _atomic_write(path, text, header=b'', footer=b''):
+    """Write text to path as UTF-8 via a temp file and rename, so readers never see a partial file.
+
+    header and footer are pre-encoded bytes written around text, so wrapping a large
+    document costs one encode and no concatenated copy.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.writelines((header, text.encode('utf-8'), footer))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _load_kv(path):
+    """Parse a 'Key: value' file into a dict in one pass; missing files give {}."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return {key.strip(): value.strip()
+                    for key, sep, value in (line.partition(':') for line in f) if sep}
+    except FileNotFoundError:
+        return {}
+
+
+class StreamBuffer:
+    """Coalesce streamed LLM tokens so UI updates fire at a bounded rate.
+
+    Tokens are held until flush_interval_ms has elapsed since the last flush or
+    min_tokens are pending, capping streaming signals at roughly 40 per second.
+    With min_tokens=None flushes are purely time-gated, which suits consumers
+    that re-send the full text on every flush. A growth factor above 1 ramps the
+    token threshold after each flush up to max_tokens, so the first tokens show
+    immediately while steady-state emits stay coarse.
+    """
+    
+    def __init__(self, flush_interval_ms=25, min_tokens=8, growth=1, max_tokens=None):
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.min_tokens = min_tokens
+        self.growth = growth
+        self.max_tokens = max_tokens if max_tokens is not None else min_tokens
+        self.pending = []
+        self.last_flush = time.monotonic()
+    
+    def add(self, token):
+        """Buffer a token. Returns True when the pending tokens should be flushed."""
+        self.pending.append(token)
+        if self.min_tokens is not None and len(self.pending) >= self.min_tokens:
+            return True
+        return time.monotonic() - self.last_flush >= self.flush_interval
+    
+    def flush(self):
+        """Return the pending text and start a new flush window."""
+        delta = ''.join(self.pending)
+        self.pending.clear()
+        self.last_flush = time.monotonic()
+        if self.min_tokens is not None and self.min_tokens < self.max_tokens:
+            self.min_tokens = min(self.max_tokens, self.min_tokens * self.growth)
+        return delta
+    
+    def feeder(self, emit_delta):
+        """Return a feed(token) closure that buffers tokens and calls emit_delta per batch.
+        
+        The buffer, clock and thresholds are bound as closure locals once, so the
+        per-token path avoids attribute lookups on self.
+        """
+        pending = self.pending
+        append = pending.append
+        clear = pending.clear
+        join = ''.join
+        monotonic = time.monotonic
+        min_tokens = self.min_tokens if self.min_tokens is not None else float('inf')
+        max_tokens = self.max_tokens if self.max_tokens is not None else min_tokens
+        growth = self.growth
+        interval = self.flush_interval
+        
+        def feed(token):
+            nonlocal min_tokens
+            append(token)
+            now = monotonic()
+            if len(pending) >= min_tokens or now - self.last_flush >= interval:
+                emit_delta(join(pending))
+                clear()
+                self.last_flush = now
+                if min_tokens < max_tokens:
+                    min_tokens = min(max_tokens, min_tokens * growth)
+        
+        return feed
+
+
+class StagedFile:
+    """Write a file incrementally to path + '.tmp', then rename it over path on commit.
+    
+    Lets streamed output hit disk as it arrives without exposing a partial file at
+    path or clobbering the previous version if generation fails. Writes are buffered
+    and flushed at most every _STAGED_FLUSH_INTERVAL, so the .tmp file trails the
+    stream by no more than that.
+    """
+    
+    def __init__(self, path, header=''):
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        self._file = open(self.tmp_path, 'w', encoding='utf-8', buffering=64 * 1024)
+        if header:
+            self._file.write(header)
+        self._next_flush = time.monotonic() + _STAGED_FLUSH_INTERVAL
+    
+    def write(self, text):
+        """Append text, flushing to disk if the last flush is older than _STAGED_FLUSH_INTERVAL."""
+        self._file.write(text)
+        now = time.monotonic()
+        if now >= self._next_flush:
+            self._file.flush()
+            self._next_flush = now + _STAGED_FLUSH_INTERVAL
+    
+    def commit(self, footer=''):
+        """Write the footer, close and atomically replace path."""
+        if footer:
+            self._file.write(footer)
+        self._file.close()
+        os.replace(self.tmp_path, self.path)
+    
+    def discard(self):
+        """Close and delete the temp file, keeping whatever was at path."""
+        self._file.close()
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+
+class LineAppender:
+    """Append lines to a file through one long-lived buffered handle.
+    
+    Replaces an open/write/close cycle per entry. The handle is opened lazily and
+    reopened when the target path changes; up to flush_every lines may sit in the
+    64 KiB userspace buffer before they are flushed to disk.
+    """
+    
+    def __init__(self, flush_every=1):
+        self.flush_every = flush_every
+        self._path = None
+        self._file = None
+        self._unflushed = 0
+        self._lock = threading.Lock()
+    
+    def write(self, path, text):
+        """Append text to path, reusing the open handle when the path is unchanged."""
+        with self._lock:
+            if path != self._path:
+                self._close()
+                self._file = open(path, 'a', encoding='utf-8', buffering=64 * 1024)
+                self._path = path
+            self._file.write(text)
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every:
+                self._file.flush()
+                self._unflushed = 0
+    
+    def close(self):
+        """Flush and close the handle."""
+        with self._lock:
+            self._close()
+    
+    def _close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+                self._path = None
+                self._unflushed = 0
+
+
 if TYPE_CHECKING:
     from typing import Optional, Dict, Any
 
 from typing import Optional
 
+# Module logger for errors that have no UI/log_update channel
+_log = logging.getLogger(__name__)
+
+# New-novel config string: "Idea: {idea}, Tone: {tone}[, Soft Target: {target}]"
+_CONFIG_RE = re.compile(r'Idea: (?P<idea>.*), Tone: (?P<tone>.*?)(?:, Soft Target: (?P<target>\d+))?$', re.DOTALL)
+
+# Project config line carrying the tone: "Tone: {tone}"
+_TONE_RE = re.compile(r'^Tone:[ \t]*(.*)$', re.M)
+
+# A polished-draft line worth logging: an inline [FLAG: ...] marker or an overused-words note
+_FLAG_LINE_RE = re.compile(r'^.*(?:\[FLAG:|(?i:overused words)).*$', re.M)
+
+# Owning window and open project folder, resolved once at the top of each stage method
+_ProjectContext = collections.namedtuple('_ProjectContext', 'window project_path')
+
+# Files every project folder must contain, as (current_project key, filename)
+PROJECT_FILES = (
+    ('story', 'story.txt'),
+    ('config', 'config.txt'),
+    ('context', 'context.txt'),
+    ('characters', 'characters.txt'),
+    ('world', 'world.txt'),
+    ('summaries', 'summaries.txt'),
+    ('buffer_backup', 'buffer_backup.txt'),
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _project_paths(project_path):
+    """Return {key: path} for PROJECT_FILES under project_path, joined once per project.
+
+    The dict is shared between callers and must not be modified.
+    """
+    return {key: os.path.join(project_path, filename) for key, filename in PROJECT_FILES}
+
+# Stage prompt templates, built once. $prefix is BackgroundThread._context_prefix(),
+# kept first so consecutive calls share a byte-identical prompt prefix
+OUTLINE_PROMPT = string.Template(
+    "Create a detailed outline for a novel with soft target $target words based on this synopsis: \"$synopsis\". "
+    "Include: 25 chapters with titles, 100–200-word summaries per chapter, key events, character developments, "
+    "dynamic chapter lengths (5000–15000 words) based on pacing. "
+    "Tone: \"$tone\". "
+    "Ensure no contradictions. "
+    "Return ONLY the outline structure, no explanation or preamble."
+)
+OUTLINE_REFINE_PROMPT = string.Template(
+    "${prefix}"
+    "Refine this novel outline based on the following feedback:\n\n"
+    "CURRENT OUTLINE:\n$outline\n\n"
+    "USER FEEDBACK:\n$feedback\n\n"
+    "INSTRUCTIONS:\n"
+    "- Incorporate the feedback while maintaining story coherence\n"
+    "- Keep the overall structure and tone\n"
+    "- Ensure chapters still align with the synopsis\n"
+    "- Return ONLY the revised outline, no explanation or preamble."
+)
+CHARACTERS_PROMPT = string.Template(
+    "${prefix}"
+    "Generate detailed profiles for the main characters in the OUTLINE above. "
+    "Include: Name, Age, Background, Traits, Arc, Relationships. "
+    "Format as JSON array of character objects. "
+    "Ensure consistency with the SYNOPSIS. "
+    "Return ONLY the JSON array, no explanation or preamble."
+)
+CHARACTERS_REFINE_PROMPT = string.Template(
+    "${prefix}"
+    "Refine the character profiles based on the following feedback:\n\n"
+    "CURRENT CHARACTERS:\n$characters\n\n"
+    "USER FEEDBACK:\n$feedback\n\n"
+    "INSTRUCTIONS:\n"
+    "- Incorporate feedback while maintaining consistency with synopsis\n"
+    "- Keep character arcs and relationships coherent\n"
+    "- Ensure character depth matches story requirements\n"
+    "- Return ONLY valid JSON array of character objects, no explanation or preamble."
+)
+WORLD_PROMPT = string.Template(
+    "${prefix}"
+    "Generate world-building details for the OUTLINE above. "
+    "Include: Tech, Culture, Geography, History, Rules. "
+    "Format as JSON dict. "
+    "Align with tone and characters. "
+    "Return ONLY the JSON dict, no explanation or preamble."
+)
+WORLD_REFINE_PROMPT = string.Template(
+    "${prefix}"
+    "Refine the world-building details based on the following feedback:\n\n"
+    "CURRENT WORLD:\n$world\n\n"
+    "USER FEEDBACK:\n$feedback\n\n"
+    "INSTRUCTIONS:\n"
+    "- Incorporate feedback while maintaining consistency with synopsis\n"
+    "- Ensure world rules and magic systems remain coherent\n"
+    "- Check for internal consistency and logical worldbuilding\n"
+    "- Return ONLY valid JSON object with world details, no explanation or preamble."
+)
+
+# Chapter-loop prompt templates for BackgroundThread.start_chapter_research_loop. Context
+# slices are taken once per run and passed in, so each section only substitutes them
+RESEARCH_PROMPT = string.Template(
+    "Generate 3-5 research points on topics relevant to Chapter $chapter from outline, "
+    "e.g., hacking in dystopia. Based on world and characters. "
+    "\n\nOutline context:\n$outline\n\n"
+    "World context:\n$world\n\n"
+    "Characters context:\n$characters\n\n"
+    "Generate focused research points for Chapter $chapter."
+)
+DRAFT_PROMPT = string.Template(
+    "Write 500-1000 words for Chapter $chapter, Section $section. "
+    "\n\nUse:\n"
+    "Timeline: $timeline\n\n"
+    "Research: $research\n\n"
+    "Tone: $tone\n\n"
+    "Context: $context\n\n"
+    "Characters: $characters\n\n"
+    "World: $world\n\n"
+    "Ensure engaging narrative, no plot holes."
+)
+DRAFT_POLISH_PROMPT = string.Template(
+    "Polish this draft: \"$draft\" "
+    "for coherence, depth, tone alignment. "
+    "Flag areas for creativity, clarity, or vocabulary overuse. "
+    "List top 5 overused words with suggestions. "
+    "Check for contradictions with prior chapters. "
+    "Return polished version with [FLAG: ...] markers for issues."
+)
+DRAFT_ENHANCE_PROMPT = string.Template(
+    "Revise the draft: \"$draft\" "
+    "by replacing overused words with synonyms from your suggestions. "
+    "Maintain flow and tone. "
+    "Return only the revised content, no explanation."
+)
+
+# Output file, signal and messages for the outline/characters/world stages run by
+# BackgroundThread._run_stage. progress_stage is saved as ready_for_approval on success
+_StageSpec = collections.namedtuple(
+    '_StageSpec', 'label filename header footer signal progress_stage retry_failed empty_warning'
+)
+
+_STAGE_SPECS = {
+    'generate_outline': _StageSpec(
+        'Outline Generation', 'outline.txt',
+        "=== NOVEL OUTLINE (25 CHAPTERS) ===\n\n", "\n\n=== END OUTLINE ===\n",
+        'new_outline', 'outline',
+        "Failed to generate outline after retries", "Warning: No outline text generated"
+    ),
+    'refine_outline': _StageSpec(
+        'Outline Refinement', 'outline.txt',
+        "=== NOVEL OUTLINE (25 CHAPTERS - REFINED) ===\n\n", "\n\n=== END OUTLINE ===\n",
+        'new_outline', None,
+        "Failed to refine outline after retries", None
+    ),
+    'generate_characters': _StageSpec(
+        'Character Generation', 'characters.txt',
+        "=== MAIN CHARACTERS (JSON) ===\n\n", "\n\n=== END CHARACTERS ===\n",
+        'new_characters', 'characters',
+        "Failed to generate characters after retries", "Warning: No character data generated"
+    ),
+    'refine_characters': _StageSpec(
+        'Character Refinement', 'characters.txt',
+        "=== MAIN CHARACTERS (JSON - REFINED) ===\n\n", "\n\n=== END CHARACTERS ===\n",
+        'new_characters', None,
+        "Failed to refine characters after retries", None
+    ),
+    'generate_world': _StageSpec(
+        'World Generation', 'world.txt',
+        "=== WORLD BUILDING (JSON) ===\n\n", "\n\n=== END WORLD ===\n",
+        'new_world', 'world',
+        "Failed to generate world after retries", "Warning: No world data generated"
+    ),
+    'refine_world': _StageSpec(
+        'World Refinement', 'world.txt',
+        "=== WORLD BUILDING (JSON - REFINED) ===\n\n", "\n\n=== END WORLD ===\n",
+        'new_world', None,
+        "Failed to refine world after retries", None
+    ),
+}
+
+# timeline.txt wrappers, pre-encoded for _atomic_write
+_TIMELINE_HEADER = b"=== NOVEL TIMELINE (WITH DATES, LOCATIONS, EVENTS) ===\n\n"
+_TIMELINE_REFINED_HEADER = b"=== NOVEL TIMELINE (WITH DATES, LOCATIONS, EVENTS - REFINED) ===\n\n"
+_TIMELINE_FOOTER = b"\n\n=== END TIMELINE ===\n"
+
 
 class BackgroundThread(QtCore.QThread):
     """Background thread for novel generation processing."""
@@ -51,23 +511,65 @@ class BackgroundThread(QtCore.QThread):
     processing_progress: QtCore.pyqtSignal = QtCore.pyqtSignal(str)
     log_update: QtCore.pyqtSignal = QtCore.pyqtSignal(str)
     init_complete: QtCore.pyqtSignal = QtCore.pyqtSignal()
-    synopsis_ready: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits synopsis text
+    synopsis_ready: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits complete synopsis text
+    synopsis_delta: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits newly streamed synopsis text only
     new_synopsis: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits refined synopsis text
     new_outline: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits generated outline text
     new_characters: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits character JSON array
     new_world: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits world-building JSON dict
     new_timeline: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits timeline with dates and events
+    timeline_delta: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits newly streamed timeline text only
     new_draft: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits polished/enhanced draft section
+    draft_delta: QtCore.pyqtSignal = QtCore.pyqtSignal(str)  # Emits newly streamed draft text only
+    draft_reset: QtCore.pyqtSignal = QtCore.pyqtSignal()  # Clears the draft display before a streamed pass
+
+    # Content type -> refinement method name; unknown types are ignored
+    _REFINEMENT_HANDLERS = {
+        'synopsis': 'refine_synopsis_with_feedback',
+        'outline': 'refine_outline_with_feedback',
+        'characters': 'refine_characters_with_feedback',
+        'world': 'refine_world_with_feedback',
+        'timeline': 'refine_timeline_with_feedback',
+        'section': 'refine_section_with_feedback',
+    }
+    
+    # Approval-triggered operation -> method name; each takes the content type
+    _OPERATION_HANDLERS = {
+        'generate_outline': 'generate_outline',
+        'generate_characters': 'generate_characters',
+        'generate_world': 'generate_world',
+        'generate_timeline': 'generate_timeline',
+        'start_chapter_research_loop': 'start_chapter_research_loop',
+        'approve_section': 'approve_section',
+    }
     
     def __init__(self, parent=None):
         """Initialize background thread."""
         super().__init__(parent)
         self.inputs = None
+        self._parent_window = None  # Owning ANSWindow, resolved once per run()
+        self._synopsis_cache = {}  # synopsis file path -> ((mtime_ns, size), stripped text)
+        self._config_cache = {}  # config.txt path -> ((mtime_ns, size), parsed dict), see _load_config
         self.buffer = ''  # Initialize buffer for content storage
-        self.backup_timer = None  # Timer for hourly backups
+        # Hourly backup tick. Created here, in the GUI thread, so the timer lives on the
+        # main event loop and repeats without spawning a thread per interval; run()
+        # starts it once project_path is set
+        self._backup_qtimer = QtCore.QTimer(self)
+        self._backup_qtimer.setInterval(3600 * 1000)
+        self._backup_qtimer.timeout.connect(self.backup)
+        self._backup_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ans-backup')  # Serializes backup file I/O
+        # World-building prefetch started after character generation; generate_world waits on it
+        self._prefetch_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ans-prefetch')
+        self._world_prefetch = None  # (Future, cancel Event) of the latest _prefetch_world, or None
+        # context.txt stays open between entries; flushed per entry because the research loop reads it back
+        self._context_appender = LineAppender()
         self.project_path = None  # Store project path for backup access
         self.synopsis = ''  # Store generated synopsis
-        self.paused = False  # Flag for pause/resume control
+        self._pause_event = threading.Event()  # Set while running, cleared while paused
+        self._pause_event.set()
+        self._abort_event = threading.Event()  # Set to cancel retry backoff waits
+        self._snapshot_drained = threading.Event()  # Set once the window has rendered the last full-text snapshot
+        self._snapshot_drained.set()
         
         # Refinement tracking for loaded content adjustments
         self.refinement_type = None  # Content type being refined ('synopsis', 'outline', etc.)
@@ -82,32 +584,88 @@ class BackgroundThread(QtCore.QThread):
         self.world_depth = 'standard'
         self.quality_check = 'moderate'
         self.sections_per_chapter = 3
+        self.reuse_responses = True  # Replay unused .llm_cache responses instead of regenerating
+        self._embed_unavailable = False  # Set for the session once the feedback embedding model fails
+    
+    def close_files(self):
+        """Close files the thread keeps open between writes (context.txt)."""
+        self._context_appender.close()
+    
+    def shutdown(self):
+        """Stop background work and close files. Called when the window closes.
+        
+        The prefetch worker is joined at interpreter exit, so its stream is cancelled
+        here rather than left to run until Ollama finishes it.
+        """
+        self.request_abort()
+        self._cancel_world_prefetch()
+        self._prefetch_exec.shutdown(wait=False, cancel_futures=True)
+        self.close_files()
     
     def load_synopsis_from_project(self, project_path):
         """Load synopsis from project files. Tries refined_synopsis.txt first, then synopsis.txt."""
         self.synopsis = ''
         
         # Try to load refined synopsis first (latest version)
-        refined_synopsis_path = os.path.join(project_path, 'refined_synopsis.txt')
-        if os.path.exists(refined_synopsis_path):
-            try:
-                with open(refined_synopsis_path, 'r', encoding='utf-8') as f:
-                    self.synopsis = f.read().strip()
-                if self.synopsis:
-                    return
-            except Exception as e:
-                self.log_update.emit(f"Failed to load refined synopsis: {str(e)}")
+        try:
+            self.synopsis = self._read_synopsis_file(os.path.join(project_path, 'refined_synopsis.txt'))
+            if self.synopsis:
+                return
+        except Exception as e:
+            self.log_update.emit(f"Failed to load refined synopsis: {str(e)}")
         
         # Fall back to initial synopsis if refined not found
-        synopsis_path = os.path.join(project_path, 'synopsis.txt')
-        if os.path.exists(synopsis_path):
-            try:
-                with open(synopsis_path, 'r', encoding='utf-8') as f:
-                    self.synopsis = f.read().strip()
-            except Exception as e:
-                self.log_update.emit(f"Failed to load initial synopsis: {str(e)}")
+        try:
+            self.synopsis = self._read_synopsis_file(os.path.join(project_path, 'synopsis.txt'))
+        except Exception as e:
+            self.log_update.emit(f"Failed to load initial synopsis: {str(e)}")
+    
+    def _read_synopsis_file(self, path):
+        """Return the stripped text of path ('' if missing), re-reading only when its mtime/size change."""
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return ''
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._synopsis_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read().strip()
+        self._synopsis_cache[path] = (stamp, text)
+        return text
     
-    def _generate_with_retry(self, parent_window, model: str, prompt: str, max_retries: Optional[int] = None):
+    def _load_config(self, path):
+        """Return the 'Key: value' dict parsed from path ({} if missing), re-parsing only when its mtime/size change.
+        
+        The dict is shared with the cache - copy it before making changes for _flush_config.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return {}
+        
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._config_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        data = _load_kv(path)
+        self._config_cache[path] = (stamp, data)
+        return data
+    
+    def _flush_config(self, path, data):
+        """Write data to path as 'Key: value' lines in one write and cache it. Returns the written text."""
+        text = ''.join(f"{key}: {value}\n" for key, value in data.items())
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        st = os.stat(path)
+        self._config_cache[path] = ((st.st_mtime_ns, st.st_size), data)
+        return text
+    
+    def _generate_with_retry(self, parent_window, model: str, prompt: str, max_retries: Optional[int] = None, use_cache: bool = False, on_cached=None):
         """Generate LLM response with automatic retry logic.
         
         Args:
@@ -115,6 +673,11 @@ class BackgroundThread(QtCore.QThread):
             model: Model name (e.g., 'gemma3:12b')
             prompt: Prompt text to send to LLM
             max_retries: Maximum number of retry attempts (default from settings)
+            use_cache: Replay/record the response in the project's .llm_cache, keyed
+                by model, temperature and prompt. A replayed entry is deleted, and
+                the cache is skipped entirely while reuse_responses is off
+            on_cached: Called once a freshly generated response has been written to
+                the cache (use_cache only)
         
         Returns:
             Generator/Iterator with streamed response, or None if all retries failed
@@ -122,23 +685,34 @@ class BackgroundThread(QtCore.QThread):
         if max_retries is None:
             max_retries = self.max_retries
         
+        cache_path = self._llm_cache_path(parent_window, model, prompt) if use_cache and self.reuse_responses else None
+        if cache_path is not None:
+            cached = self._take_cached_response(cache_path)
+            if cached is not None:
+                self.log_update.emit("Replaying cached LLM response for identical prompt")
+                return _replay_chunks(cached)
+        
+        client = getattr(parent_window, 'client', None)
+        if client is None:
+            self.log_update.emit(f"Error: Parent window has no LLM client")
+            return None
+        
         for attempt in range(max_retries):
             try:
-                if not hasattr(parent_window, 'client'):
-                    self.log_update.emit(f"Error: Parent window has no LLM client")
-                    return None
-                
-                stream = parent_window.client.generate(
+                stream = client.generate(
                     model=model,
                     prompt=prompt,
                     stream=True,
-                    options={'temperature': self.temperature}
+                    options={'temperature': self.temperature},
+                    keep_alive=_OLLAMA_KEEP_ALIVE
                 )
                 
                 if not hasattr(stream, '__iter__'):
                     self.log_update.emit(f"Error: LLM response is not iterable")
                     return None
                 
+                if cache_path is not None:
+                    return self._record_stream(stream, cache_path, on_cached)
                 return stream
             
             except Exception as e:
@@ -146,9 +720,10 @@ class BackgroundThread(QtCore.QThread):
                 self.log_update.emit(f"LLM connection attempt {attempt_num}/{max_retries} failed: {str(e)}")
                 
                 if attempt_num < max_retries:
-                    # Wait before retry (exponential backoff: 1s, 2s, 4s)
-                    import time
-                    time.sleep(2 ** attempt)
+                    # Wait before retry (exponential backoff: 1s, 2s, 4s) - returns early on abort
+                    if self._abort_event.wait(2 ** attempt):
+                        self.log_update.emit("LLM retry cancelled")
+                        return None
                 else:
                     error_msg = f"Failed to connect to LLM after {max_retries} attempts: {str(e)}"
                     self.log_update.emit(error_msg)
@@ -156,18 +731,200 @@ class BackgroundThread(QtCore.QThread):
                         parent_window.error_signal.emit(error_msg)
                     return None
     
+    def _context_prefix(self, outline_content=None):
+        """Return the shared SYNOPSIS (+ OUTLINE) block that leads stage prompts.
+        
+        Keeping this text first and byte-identical across calls lets the Ollama
+        runner reuse its KV cache for the prefix instead of re-prefilling it.
+        """
+        prefix = f"SYNOPSIS:\n{self.synopsis}\n\n"
+        if outline_content:
+            prefix += f"OUTLINE:\n{outline_content.strip()}\n\n"
+        return prefix
+    
+    def _llm_cache_path(self, parent_window, model, prompt):
+        """Return the .llm_cache file for this request, or None without an open project."""
+        project = getattr(parent_window, 'current_project', None)
+        if not project:
+            return None
+        key = hashlib.sha256(f"{model}\0{self.temperature}\0{prompt}".encode('utf-8')).hexdigest()
+        return os.path.join(project['path'], '.llm_cache', key + '.txt')
+    
+    def _take_cached_response(self, cache_path):
+        """Return a cached response younger than _LLM_CACHE_TTL and delete it, or None.
+        
+        Each recorded response replays at most once: a retry after a failed or
+        interrupted step gets it back, but asking again for the same prompt - usually
+        because the result was poor - samples a fresh one.
+        """
+        try:
+            if time.time() - os.stat(cache_path).st_mtime > _LLM_CACHE_TTL:
+                os.remove(cache_path)
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            os.remove(cache_path)
+            return text or None
+        except OSError:
+            return None
+    
+    def _record_stream(self, stream, cache_path, on_cached=None):
+        """Pass chunks through unchanged, saving the full response once the stream completes.
+        
+        on_cached, if given, is called after the response has been written.
+        """
+        parts = []
+        append = parts.append
+        chunks = iter(stream)
+        first = next(chunks, None)
+        if first is None:
+            return
+        
+        extract = _make_token_extractor(first)
+        for chunk in itertools.chain((first,), chunks):
+            token = extract(chunk)
+            if token:
+                append(token)
+            yield chunk
+        
+        # Only complete responses reach this point - an interrupted stream raises above
+        if parts:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                _atomic_write(cache_path, ''.join(parts))
+            except OSError as e:
+                self.log_update.emit(f"Warning: Could not cache LLM response: {str(e)}")
+                return
+            if on_cached is not None:
+                on_cached()
+    
+    def _refinement_stream(self, parent_window, prompt, stage, base_content, feedback):
+        """Return a refinement stream, replaying an earlier result for paraphrased feedback.
+        
+        Feedback is embedded and compared with earlier feedback on the same stage and
+        unchanged content (synopsis + base_content). A match above
+        _FEEDBACK_MATCH_THRESHOLD replays that refinement from .llm_cache; otherwise
+        the prompt is sent through _generate_with_retry's exact-match cache and the
+        feedback is indexed against its cache file once the response is written.
+        """
+        base_key = hashlib.sha256(f"{stage}\0{self.synopsis}\0{base_content}".encode('utf-8')).hexdigest()
+        vector = self._embed_feedback(parent_window, feedback) if self.reuse_responses else None
+        if vector is not None:
+            cached = self._match_feedback(parent_window, base_key, vector)
+            if cached is not None:
+                self.log_update.emit("Replaying cached refinement for similar feedback")
+                return _replay_chunks(cached)
+        
+        on_cached = None
+        if vector is not None:
+            on_cached = functools.partial(self._remember_feedback, parent_window, base_key, vector, prompt)
+        
+        return self._generate_with_retry(
+            parent_window,
+            model=self.llm_model,
+            prompt=prompt,
+            max_retries=3,
+            use_cache=True,
+            on_cached=on_cached
+        )
+    
+    def _embed_feedback(self, parent_window, feedback):
+        """Return the unit-length embedding of feedback, or None if unavailable.
+        
+        A failed or missing embedding model is remembered for the session, so later
+        refinements skip the request and the warning. The embedding model is
+        unloaded straight after use to leave the writer model's VRAM alone.
+        """
+        client = getattr(parent_window, 'client', None)
+        if client is None or self._embed_unavailable or not feedback.strip():
+            return None
+        try:
+            vector = client.embeddings(model=_FEEDBACK_EMBED_MODEL, prompt=feedback.strip(), keep_alive=0)['embedding']
+        except Exception as e:
+            self._embed_unavailable = True
+            self.log_update.emit(f"Warning: Feedback embedding unavailable, paraphrase matching off for this session: {str(e)}")
+            return None
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else None
+    
+    def _feedback_index_path(self, parent_window):
+        """Return the project's feedback embedding index path, or None without a project."""
+        project = getattr(parent_window, 'current_project', None)
+        if not project:
+            return None
+        return os.path.join(project['path'], '.llm_cache', 'feedback_index.json')
+    
+    def _match_feedback(self, parent_window, base_key, vector):
+        """Return the cached refinement whose feedback best matches vector, or None."""
+        index_path = self._feedback_index_path(parent_window)
+        if index_path is None:
+            return None
+        try:
+            with open(index_path, 'rb') as f:
+                entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        
+        best, best_score = None, _FEEDBACK_MATCH_THRESHOLD
+        for entry in entries:
+            if entry['base'] != base_key or len(entry['embedding']) != len(vector):
+                continue
+            score = sum(map(operator.mul, vector, entry['embedding']))
+            if score >= best_score:
+                best, best_score = entry, score
+        if best is None:
+            return None
+        return self._take_cached_response(os.path.join(os.path.dirname(index_path), best['response']))
+    
+    def _remember_feedback(self, parent_window, base_key, vector, prompt):
+        """Index vector against the cache file the exact-match cache wrote for prompt.
+        
+        Entries whose response is gone (replayed or expired) are dropped, and at most
+        _FEEDBACK_BASE_LIMIT are kept per base key, so the index stays small.
+        """
+        index_path = self._feedback_index_path(parent_window)
+        cache_path = self._llm_cache_path(parent_window, self.llm_model, prompt)
+        if index_path is None or cache_path is None:
+            return
+        try:
+            with open(index_path, 'rb') as f:
+                entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            entries = []
+        
+        cache_dir = os.path.dirname(index_path)
+        entries = [entry for entry in entries
+                   if os.path.exists(os.path.join(cache_dir, entry['response']))]
+        entries.append({'base': base_key, 'embedding': vector, 'response': os.path.basename(cache_path)})
+        
+        # Keep the newest _FEEDBACK_BASE_LIMIT entries per base key
+        kept = []
+        per_base = collections.Counter()
+        for entry in reversed(entries):
+            per_base[entry['base']] += 1
+            if per_base[entry['base']] <= _FEEDBACK_BASE_LIMIT:
+                kept.append(entry)
+        kept.reverse()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = index_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(kept[-_FEEDBACK_INDEX_LIMIT:]))
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            self.log_update.emit(f"Warning: Could not update feedback index: {str(e)}")
+    
     def run(self):
         """Main thread execution. Parse inputs and emit status."""
         try:
+            # Resolve and validate the owning window once for every branch below
+            parent_window = self._resolve_parent_window()
+            if parent_window is None:
+                return
+            
             # Check if this is a refinement operation on loaded content
             if isinstance(self.inputs, dict) and self.inputs.get('refinement'):
                 # Handle refinement of loaded content
-                parent = self.parent()
-                if parent is None or parent.__class__.__name__ != 'ANSWindow':
-                    self.processing_error.emit("No active project context")
-                    return
-                
-                parent_window = parent  # type: ignore
                 content_type = self.inputs.get('type')
                 feedback = self.inputs.get('feedback', '')
                 
@@ -176,29 +933,14 @@ class BackgroundThread(QtCore.QThread):
                     self.load_synopsis_from_project(parent_window.current_project['path'])  # type: ignore
                 
                 # Call the appropriate refinement method
-                if content_type == 'synopsis':
-                    self.refine_synopsis_with_feedback(content_type, feedback)
-                elif content_type == 'outline':
-                    self.refine_outline_with_feedback(content_type, feedback)
-                elif content_type == 'characters':
-                    self.refine_characters_with_feedback(content_type, feedback)
-                elif content_type == 'world':
-                    self.refine_world_with_feedback(content_type, feedback)
-                elif content_type == 'timeline':
-                    self.refine_timeline_with_feedback(content_type, feedback)
-                elif content_type == 'section':
-                    self.refine_section_with_feedback(content_type, feedback)
+                handler = getattr(self, self._REFINEMENT_HANDLERS.get(content_type, ''), None)
+                if handler is not None:
+                    handler(content_type, feedback)
                 return
             
             # Check if this is a generation operation (not a novel generation config string)
             if isinstance(self.inputs, dict) and self.inputs.get('operation'):
                 # Handle approval-triggered operations
-                parent = self.parent()
-                if parent is None or parent.__class__.__name__ != 'ANSWindow':
-                    self.processing_error.emit("No active project context")
-                    return
-                
-                parent_window = parent  # type: ignore
                 operation = self.inputs.get('operation')
                 content_type = self.inputs.get('type')
                 
@@ -207,18 +949,9 @@ class BackgroundThread(QtCore.QThread):
                     self.load_synopsis_from_project(parent_window.current_project['path'])  # type: ignore
                 
                 # Execute the appropriate operation
-                if operation == 'generate_outline':
-                    self.generate_outline(content_type)
-                elif operation == 'generate_characters':
-                    self.generate_characters(content_type)
-                elif operation == 'generate_world':
-                    self.generate_world(content_type)
-                elif operation == 'generate_timeline':
-                    self.generate_timeline(content_type)
-                elif operation == 'start_chapter_research_loop':
-                    self.start_chapter_research_loop()
-                elif operation == 'approve_section':
-                    self.approve_section(content_type)
+                handler = getattr(self, self._OPERATION_HANDLERS.get(operation, ''), None)
+                if handler is not None:
+                    handler(content_type)
                 return
             
             # Validate inputs exist
@@ -227,40 +960,19 @@ class BackgroundThread(QtCore.QThread):
                 return
             
             # Parse configuration string: "Idea: {idea}, Tone: {tone}, Soft Target: {target}"
-            # Look for separators from the end to extract soft target first
-            soft_target = 250000
-            inputs_str = str(self.inputs)
-            
-            # Try to extract soft target from end
-            soft_target_match = re.search(r', Soft Target: (\d+)$', inputs_str)
-            if soft_target_match:
-                soft_target = int(soft_target_match.group(1))
-                # Remove the soft target from the string
-                inputs_str = inputs_str[:soft_target_match.start()]
-            
-            # Now find where "Idea:" and ", Tone:" are
-            idea_start = inputs_str.find('Idea: ')
-            tone_start = inputs_str.rfind(', Tone: ')  # Use rfind to get the last occurrence
-            
-            if idea_start == -1 or tone_start == -1:
+            # Single pass: the last ", Tone: " splits idea from tone, Soft Target is optional
+            config_match = _CONFIG_RE.search(str(self.inputs))
+            if not config_match:
                 self.processing_error.emit(f"Invalid config format: {self.inputs}")
                 return
             
-            # Extract idea and tone
-            idea = inputs_str[idea_start + 6:tone_start].strip()  # Skip "Idea: "
-            tone = inputs_str[tone_start + 8:].strip()  # Skip ", Tone: "
+            idea = config_match.group('idea').strip()
+            tone = config_match.group('tone').strip()
+            soft_target = int(config_match.group('target')) if config_match.group('target') else 250000
             
             # Emit log update with parsing result
             log_msg = f"Parsed config - Idea: {idea[:50]}..., Tone: {tone[:50]}..., Soft Target: {soft_target}"
             self.log_update.emit(log_msg)
-            # Get parent window (ANSWindow) to access current_project
-            parent = self.parent()
-            # Validate parent is ANSWindow before proceeding (check by class name to avoid forward reference)
-            if parent is None or parent.__class__.__name__ != 'ANSWindow':
-                self.processing_error.emit("No active project context")
-                return
-            
-            parent_window = parent  # type: ignore  # parent is ANSWindow at runtime
             if not hasattr(parent_window, 'current_project') or not parent_window.current_project:  # type: ignore
                 self.processing_error.emit("No active project")
                 return
@@ -286,15 +998,14 @@ class BackgroundThread(QtCore.QThread):
             # Update context.txt with initial context
             context_entry = f"Novel started: {idea}. Initial tone: {tone}."
             context_path = os.path.join(project_path, 'context.txt')
-            with open(context_path, 'a', encoding='utf-8') as f:
-                f.write(context_entry + "\n")
+            self._context_appender.write(context_path, context_entry + "\n")
             self.log_update.emit(f"Updated context.txt with novel start information")
             
-            # Store project path and start backup timer (3600 seconds = 1 hour)
+            # Store project path and (re)start the hourly backup timer, so the first backup
+            # comes an hour into this project. The timer lives on the GUI thread, hence the
+            # queued start rather than calling start() from this worker thread
             self.project_path = project_path
-            self.backup_timer = threading.Timer(3600, self.backup)
-            self.backup_timer.daemon = True
-            self.backup_timer.start()
+            QtCore.QMetaObject.invokeMethod(self._backup_qtimer, 'start', QtCore.Qt.QueuedConnection)
             self.log_update.emit("Backup timer started (1 hour interval)")
             
             # Emit initialization complete signal
@@ -303,13 +1014,6 @@ class BackgroundThread(QtCore.QThread):
             
             # Generate synopsis using LLM
             self.log_update.emit("Starting synopsis generation...")
-            parent_window_check = self.parent()
-            if parent_window_check is None or not isinstance(parent_window_check, QtWidgets.QMainWindow):
-                self.log_update.emit("Synopsis generation: Invalid parent window")
-                return
-            
-            parent_window = parent_window_check
-            
             if not hasattr(parent_window, 'client'):
                 self.log_update.emit("Synopsis generation: Parent has no client attribute")
                 return
@@ -332,10 +1036,6 @@ class BackgroundThread(QtCore.QThread):
                 
                 self.log_update.emit(f"Streaming LLM response (tokens arriving in real-time)...")
                 
-                # Stream the response and collect tokens
-                self.synopsis = ''
-                token_count = 0
-                
                 # Use retry helper to get stream
                 stream = self._generate_with_retry(
                     parent_window,
@@ -348,46 +1048,12 @@ class BackgroundThread(QtCore.QThread):
                     self.log_update.emit("Failed to generate synopsis after retries")
                     return
                 
-                # Collect tokens from stream
-                for chunk in stream:
-                    # Check if paused
-                    self.wait_while_paused()
-                    
-                    try:
-                        # Handle both dict and GenerateResponse object formats
-                        token = None
-                        
-                        # First try dict access for raw API responses
-                        if isinstance(chunk, dict) and 'response' in chunk:
-                            token = chunk['response']
-                        # Then try object attribute access for ollama._types.GenerateResponse
-                        elif hasattr(chunk, 'response'):
-                            token = chunk.response  # type: ignore
-                        
-                        if token:
-                            self.synopsis += token
-                            token_count += 1
-                            
-                            # Update synopsis display live every token for real-time rendering
-                            self.synopsis_ready.emit(self.synopsis)
-                            
-                            # Log every 100 tokens to avoid log spam
-                            if token_count % 100 == 0:
-                                self.log_update.emit(f"[Streaming] {token_count} tokens received...")
-                        else:
-                            # Skip empty/invalid chunks silently instead of warning
-                            pass
-                    
-                    except Exception as e:
-                        self.log_update.emit(f"Warning: Error processing chunk: {str(e)}")
-                        continue
-                
-                word_count = len(self.synopsis.split())
+                # Collect tokens from stream, streaming only new text to the display
+                self.synopsis, token_count, word_count = self._consume_stream(stream, self.synopsis_delta.emit, 'Streaming')
                 
                 # Save initial synopsis to synopsis.txt
                 synopsis_path = os.path.join(project_path, 'synopsis.txt')
-                with open(synopsis_path, 'w', encoding='utf-8') as f:
-                    f.write(self.synopsis)
+                _atomic_write(synopsis_path, self.synopsis)
                 
                 # Log only once at the end of generation
                 self.log_update.emit(f"Synopsis generation complete: {word_count} words ({token_count} tokens)")
@@ -407,60 +1073,42 @@ class BackgroundThread(QtCore.QThread):
                     f"Return ONLY the revised synopsis, no explanation or preamble."
                 )
                 
-                refined_synopsis = ''
-                refinement_token_count = 0
+                # The draft is on disk and embedded in the prompt - don't keep a third copy
+                # alive while the refined text streams in; it is re-read if refinement fails
+                self.synopsis = ''
                 
-                # Use retry helper for refinement
-                refinement_stream = self._generate_with_retry(
-                    parent_window,
-                    model=self.llm_model,
-                    prompt=refinement_prompt,
-                    max_retries=3
-                )
+                try:
+                    # Use retry helper for refinement
+                    refinement_stream = self._generate_with_retry(
+                        parent_window,
+                        model=self.llm_model,
+                        prompt=refinement_prompt,
+                        max_retries=3
+                    )
                 
-                if refinement_stream is not None:
-                    # Collect refined tokens
-                    for chunk in refinement_stream:
-                        # Check if paused
-                        self.wait_while_paused()
-                        
-                        try:
-                            # Handle both dict and GenerateResponse object formats
-                            token = None
-                            
-                            if isinstance(chunk, dict) and 'response' in chunk:
-                                token = chunk['response']
-                            elif hasattr(chunk, 'response'):
-                                token = chunk.response  # type: ignore
-                            
-                            if token:
-                                refined_synopsis += token
-                                refinement_token_count += 1
-                                
-                                # Log every 100 tokens to avoid spam
-                                if refinement_token_count % 100 == 0:
-                                    self.log_update.emit(f"[Refinement] {refinement_token_count} tokens received...")
-                        
-                        except Exception as e:
-                            self.log_update.emit(f"Warning: Error processing refinement chunk: {str(e)}")
-                            continue
+                    if refinement_stream is not None:
+                        # Collect refined tokens
+                        refined_synopsis, refinement_token_count, refined_word_count = self._consume_stream(refinement_stream, None, 'Refinement')
                     
-                    # Update synopsis with refined version
-                    if refined_synopsis:
-                        self.synopsis = refined_synopsis
-                        refined_word_count = len(self.synopsis.split())
+                        # Update synopsis with refined version
+                        if refined_synopsis:
+                            self.synopsis = refined_synopsis
                         
-                        # Save refined synopsis to refined_synopsis.txt
-                        refined_synopsis_path = os.path.join(project_path, 'refined_synopsis.txt')
-                        with open(refined_synopsis_path, 'w', encoding='utf-8') as f:
-                            f.write(self.synopsis)
+                            # Save refined synopsis to refined_synopsis.txt
+                            refined_synopsis_path = os.path.join(project_path, 'refined_synopsis.txt')
+                            _atomic_write(refined_synopsis_path, self.synopsis)
                         
-                        self.log_update.emit(f"Synopsis refinement complete: {refined_word_count} words ({refinement_token_count} tokens)")
+                            self.log_update.emit(f"Synopsis refinement complete: {refined_word_count} words ({refinement_token_count} tokens)")
                         
-                        # Emit new_synopsis signal with refined text
-                        self.new_synopsis.emit(self.synopsis)
-                else:
-                    self.log_update.emit("Synopsis refinement failed after retries")
+                            # Emit new_synopsis signal with refined text
+                            self.new_synopsis.emit(self.synopsis)
+                    else:
+                        self.log_update.emit("Synopsis refinement failed after retries")
+                finally:
+                    # Fall back to the saved draft when refinement produced nothing or raised
+                    if not self.synopsis:
+                        with open(synopsis_path, 'r', encoding='utf-8') as f:
+                            self.synopsis = f.read()
             
             except Exception as e:
                 self.log_update.emit(f"Synopsis generation error: {str(e)}")
@@ -469,111 +1117,362 @@ class BackgroundThread(QtCore.QThread):
             self.processing_error.emit(f"Error in run(): {str(e)}")
     
     def backup(self):
-        """Perform hourly backup of story, log, and buffer files."""
+        """Hourly backup tick: queue the file work on the backup worker."""
         try:
             if not self.project_path:
                 return
             
+            # File copies run on a single-worker pool so they never stall token streaming
+            self._backup_exec.submit(self._do_backup_blocking, self.project_path, self.buffer)
+        except Exception as e:
+            self.log_update.emit(f"Backup error: {str(e)}")
+    
+    def _do_backup_blocking(self, project_path, buffer_text):
+        """Perform backup of story, log, and buffer files. Runs on the backup worker."""
+        try:
             # Generate timestamp for backup files
             timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
             
-            # Backup story.txt
-            story_src = os.path.join(self.project_path, 'story.txt')
-            story_backup = os.path.join(self.project_path, f'story_backup_{timestamp}.txt')
-            if os.path.exists(story_src):
-                with open(story_src, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                with open(story_backup, 'w', encoding='utf-8') as f:
-                    f.write(content)
-            
-            # Backup log.txt
-            log_src = os.path.join(self.project_path, 'log.txt')
-            log_backup = os.path.join(self.project_path, f'log_backup_{timestamp}.txt')
-            if os.path.exists(log_src):
-                with open(log_src, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                with open(log_backup, 'w', encoding='utf-8') as f:
-                    f.write(content)
+            # Backup story.txt and log.txt - copy to a temp name, then rename so no partial backups exist
+            for name in ('story', 'log'):
+                src = os.path.join(project_path, f'{name}.txt')
+                dst = os.path.join(project_path, f'{name}_backup_{timestamp}.txt')
+                try:
+                    _copy_file(src, dst + '.tmp')
+                except FileNotFoundError:
+                    continue
+                os.replace(dst + '.tmp', dst)
             
             # Overwrite buffer_backup.txt with current buffer
-            buffer_backup_path = os.path.join(self.project_path, 'buffer_backup.txt')
-            with open(buffer_backup_path, 'w', encoding='utf-8') as f:
-                f.write(self.buffer)
+            buffer_backup_path = os.path.join(project_path, 'buffer_backup.txt')
+            with open(buffer_backup_path + '.tmp', 'wb') as f:
+                f.write(buffer_text.encode('utf-8'))
+            os.replace(buffer_backup_path + '.tmp', buffer_backup_path)
             
             self.log_update.emit(f"Backup completed: story_backup_{timestamp}.txt, log_backup_{timestamp}.txt, buffer_backup.txt")
             
-            # Restart timer for next backup in 1 hour
-            self.backup_timer = threading.Timer(3600, self.backup)
-            self.backup_timer.daemon = True
-            self.backup_timer.start()
-            
         except Exception as e:
             self.log_update.emit(f"Backup error: {str(e)}")
     
     def start_processing(self, data):
         """Store input data and start thread execution. Handles thread restart safely."""
         self.inputs = data
+        # Only generate_world uses the world prefetch - anything else would queue behind it
+        if not (isinstance(data, dict) and data.get('operation') == 'generate_world'):
+            self._cancel_world_prefetch()
         # Reset thread state - QThread can only be started once, so we start fresh
         if self.isRunning():
+            # Cut short any retry backoff so the previous run can finish
+            self.request_abort()
             self.quit()
             # Wait for thread to finish with 5 second timeout
             if not self.wait(5000):  # 5000 milliseconds = 5 seconds
                 self.log_update.emit("Warning: Previous thread did not finish in time, forcing start")
+        self._abort_event.clear()
         self.start()
     
+    def request_abort(self):
+        """Ask the running operation to stop waiting between LLM retries."""
+        self._abort_event.set()
+    
     def set_paused(self, paused):
         """Set pause state of the background thread."""
-        self.paused = paused
+        if paused:
+            self._pause_event.clear()
+        else:
+            self._pause_event.set()
     
     def is_paused(self):
         """Check if background thread is paused."""
-        return self.paused
+        return not self._pause_event.is_set()
+    
+    def snapshot_drained(self):
+        """Mark the last streamed full-text snapshot as rendered. Connected to snapshot signals by the window."""
+        self._snapshot_drained.set()
     
     def wait_while_paused(self):
         """Block execution until thread is resumed. Called during long operations."""
-        while self.paused:
-            QtCore.QThread.msleep(100)  # Sleep for 100ms to avoid busy-wait
+        # Blocks in the kernel while paused and wakes as soon as resume sets the event,
+        # checking for an abort every _PAUSE_POLL_INTERVAL so closing the app is never
+        # held up by a pause; the lock-free is_set() check keeps the running case to a
+        # single flag read
+        if not self._pause_event.is_set():
+            while not self._pause_event.wait(_PAUSE_POLL_INTERVAL):
+                if self._abort_event.is_set():
+                    return
     
-    def refine_synopsis_with_feedback(self, content_type, feedback):
-        """Refine synopsis based on user feedback. Only processes 'synopsis' type."""
-        if content_type != 'synopsis':
-            return
-        # Get parent window to access tone and client
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for refinement")
-            return
+    def _project_context(self, purpose):
+        """Return the owning window and open project path, logging once when either is missing.
         
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for refinement")
-            return
+        Args:
+            purpose: Operation name for the error message (e.g. 'outline generation')
         
-        # Ensure we have the synopsis to refine
-        if not self.synopsis:
-            self.log_update.emit("[DEBUG] Synopsis not in memory, loading from project...")
-            self.load_synopsis_from_project(parent_window.current_project['path'])
+        Returns:
+            _ProjectContext, or None if there is no window or no open project
+        """
+        parent_window = self._parent_window or self.parent()
+        if parent_window is None or parent_window.__class__.__name__ != 'ANSWindow':
+            self.log_update.emit(f"Error: No active window context for {purpose}")
+            return None
+        project = parent_window.current_project  # type: ignore[attr-defined]
+        if not project:
+            self.log_update.emit(f"Error: No active project for {purpose}")
+            return None
+        return _ProjectContext(parent_window, project['path'])
+    
+    def _resolve_parent_window(self):
+        """Return the owning ANSWindow, or None after emitting processing_error."""
+        parent = self.parent()
+        # Check by class name to avoid a forward reference to ANSWindow
+        if parent is None or parent.__class__.__name__ != 'ANSWindow':
+            self.processing_error.emit("No active project context")
+            return None
+        self._parent_window = parent
+        return parent
+    
+    def _consume_stream(self, stream, on_delta, label, min_tokens=8, growth=1, max_tokens=None, flush_interval_ms=25):
+        """Drain an LLM token stream, passing batched new text to on_delta.
         
-        if not self.synopsis:
-            self.log_update.emit("Error: No synopsis available for refinement")
-            return
+        Args:
+            stream: Iterator returned by _generate_with_retry
+            on_delta: Callable receiving each flushed batch of new text, or None
+            label: Tag for the periodic progress log (e.g. 'Streaming')
+            min_tokens: Pending tokens that force a flush, or None for time-gated flushes only
+            growth: Factor applied to min_tokens after each flush, up to max_tokens
+            max_tokens: Ceiling for the ramped flush threshold
+            flush_interval_ms: Longest time tokens are held before a flush
         
-        self.log_update.emit(f"[DEBUG] Synopsis loaded: {len(self.synopsis)} characters")
+        Returns:
+            Tuple of (complete text, token count, word count)
+        """
+        parts = []
+        append = parts.append
+        token_count = 0
+        stream_buffer = StreamBuffer(flush_interval_ms, min_tokens, growth, max_tokens)
+        pause_event = self._pause_event
+        # is_set() is a plain flag read; wait() takes the event's lock, so only call it when paused
+        is_running = pause_event.is_set
+        wait_for_resume = pause_event.wait
+        feed = None
+        if on_delta is not None:
+            deliver = on_delta
+            
+            # Honour pause at batch boundaries - the display stops at the last flushed batch
+            def on_delta(delta):
+                if not is_running():
+                    wait_for_resume()
+                deliver(delta)
+            
+            feed = stream_buffer.feeder(on_delta)
+        log = self.log_update.emit
+        monotonic = time.monotonic
+        next_log_at = 100
+        last_log = 0.0
+        
+        # A reader thread pulls chunks off the HTTP stream so socket reads overlap
+        # with batching and signal emission here
+        token_queue = queue.SimpleQueue()
+        reader_state = {'error': None, 'words': 0}
+        reader = threading.Thread(target=self._read_stream, args=(stream, token_queue, reader_state), daemon=True)
+        reader.start()
+        get_token = token_queue.get
+        
+        while True:
+            token = get_token()
+            if token is _STREAM_END:
+                break
+            
+            append(token)
+            token_count += 1
+            
+            # Flush in batches (~40 updates/sec) rather than every token
+            if feed is not None:
+                feed(token)
+            
+            # Log every 100 tokens to avoid log spam (compare against a precomputed threshold),
+            # and no more than every _PROGRESS_LOG_INTERVAL when tokens arrive in bursts
+            if token_count >= next_log_at:
+                next_log_at += 100
+                # Streams without a display have no batches, so pause is honoured here
+                if not is_running():
+                    wait_for_resume()
+                now = monotonic()
+                if now - last_log >= _PROGRESS_LOG_INTERVAL:
+                    last_log = now
+                    log(f"[{label}] {token_count} tokens received...")
+        
+        # Surface connection errors from the reader to the caller, as direct iteration did
+        if reader_state['error'] is not None:
+            raise reader_state['error']
+        
+        # Deliver whatever is left in the last batch
+        if on_delta is not None and stream_buffer.pending:
+            on_delta(stream_buffer.flush())
+        
+        return ''.join(parts), token_count, reader_state['words']
+    
+    def _read_stream(self, stream, token_queue, reader_state):
+        """Reader thread body: queue non-empty tokens from stream, then _STREAM_END.
+        
+        Also counts words as tokens arrive - the reader is mostly idle waiting on the
+        socket, so this keeps the final len(text.split()) pass off the consumer.
+        Pausing stops the reader too, so the HTTP stream is back-pressured rather
+        than drained into the queue.
+        """
+        wait_while_paused = self.wait_while_paused
+        try:
+            words = 0
+            in_word = False
+            chunks = iter(stream)
+            first = next(chunks, None)
+            if first is None:
+                return
+            
+            # Ollama streams homogeneous chunks - pick the dict or GenerateResponse
+            # extractor from the first chunk, then map it over the rest in C
+            for token in map(_make_token_extractor(first), itertools.chain((first,), chunks)):
+                if token:
+                    wait_while_paused()
+                    token_queue.put(token)
+                    # A token starting mid-word continues the previous token's last word
+                    words += len(token.split())
+                    if in_word and not token[0].isspace():
+                        words -= 1
+                    in_word = not token[-1].isspace()
+            reader_state['words'] = words
+        except Exception as e:
+            reader_state['error'] = e
+        finally:
+            token_queue.put(_STREAM_END)
+    
+    def _stream_and_emit(self, stream, signal, label, save_path=None, header='', footer=''):
+        """Stream into a full-text signal, emitting in batches that grow 1 -> 3 -> 9 -> 27 -> 32 tokens.
         
-        # Get tone from the novel idea inputs if available
-        tone = ""
-        if hasattr(parent_window, 'tone_input'):
-            tone = parent_window.tone_input.toPlainText().strip()
+        With save_path, each batch is also written through to save_path + '.tmp' as it
+        arrives, wrapped in header/footer, and renamed over save_path once the stream
+        completes with text. The previous file is left untouched on failure.
         
-        if not tone:
-            tone = "as originally specified"
+        Returns:
+            Tuple of (complete text, token count, word count)
+        """
+        on_delta = self._cumulative_emitter(signal)
+        staged = None
+        if save_path is not None:
+            staged = StagedFile(save_path, header)
+            emit_delta, write_delta = on_delta, staged.write
+            
+            def on_delta(delta):
+                write_delta(delta)
+                emit_delta(delta)
         
-        # Emit refinement_start signal to clear display and disable buttons
-        refinement_start_signal = parent_window.refinement_start if hasattr(parent_window, 'refinement_start') else None
-        if refinement_start_signal:
-            refinement_start_signal.emit()
+        try:
+            result = self._consume_stream(
+                stream, on_delta, label,
+                min_tokens=1, growth=3, max_tokens=32, flush_interval_ms=33
+            )
+        except BaseException:
+            if staged is not None:
+                staged.discard()
+            raise
+        
+        if staged is not None:
+            if result[0]:
+                staged.commit(footer)
+            else:
+                staged.discard()
+        return result
+    
+    def _stream_to_file(self, stream, label, save_path, header=''):
+        """Stream into save_path + '.tmp' as tokens arrive, renaming it over save_path on completion.
         
-        # Generate refinement prompt WITH FULL SYNOPSIS CONTEXT
+        Batches are written through StagedFile while the model is still generating, so
+        the file is on disk when the stream ends. The previous file is left untouched
+        when the stream fails or yields no text.
+        
+        Returns:
+            Tuple of (complete text, token count, word count)
+        """
+        staged = StagedFile(save_path, header)
+        try:
+            result = self._consume_stream(stream, staged.write, label)
+        except BaseException:
+            staged.discard()
+            raise
+        
+        if result[0]:
+            staged.commit()
+        else:
+            staged.discard()
+        return result
+    
+    def _stream_throttled(self, stream, delta_signal, label):
+        """Stream into a delta signal, emitting newly arrived text at most once per _UI_EMIT_INTERVAL_MS.
+        
+        Each emit carries only the text since the previous one, so the receiving widget
+        appends instead of re-rendering the whole accumulated string.
+        
+        Returns:
+            Tuple of (complete text, token count, word count)
+        """
+        return self._consume_stream(
+            stream, delta_signal.emit, label,
+            min_tokens=None, flush_interval_ms=_UI_EMIT_INTERVAL_MS
+        )
+    
+    def _cumulative_emitter(self, signal):
+        """Adapt a full-text signal into an on_delta callback for _consume_stream.
+        
+        At most one snapshot is in flight: while the window has not yet rendered the
+        previous one, newer batches are only accumulated, and the next emit carries
+        everything. Callers always finish with an unconditional emit of the full text.
+        """
+        shown = []
+        drained = self._snapshot_drained
+        drained.set()  # nothing from this stream is queued yet
+        
+        def emit(delta):
+            shown.append(delta)
+            if drained.is_set():
+                drained.clear()
+                signal.emit(''.join(shown))
+        
+        return emit
+    
+    def refine_synopsis_with_feedback(self, content_type, feedback):
+        """Refine synopsis based on user feedback. Only processes 'synopsis' type."""
+        if content_type != 'synopsis':
+            return
+        # Get parent window to access tone and client
+        ctx = self._project_context('refinement')
+        if ctx is None:
+            return
+        parent_window: 'ANSWindow' = ctx.window
+        
+        # Ensure we have the synopsis to refine
+        if not self.synopsis:
+            self.log_update.emit("[DEBUG] Synopsis not in memory, loading from project...")
+            self.load_synopsis_from_project(ctx.project_path)
+        
+        if not self.synopsis:
+            self.log_update.emit("Error: No synopsis available for refinement")
+            return
+        
+        self.log_update.emit(f"[DEBUG] Synopsis loaded: {len(self.synopsis)} characters")
+        
+        # Get tone from the novel idea inputs if available
+        tone = ""
+        if hasattr(parent_window, 'tone_input'):
+            tone = parent_window.tone_input.toPlainText().strip()
+        
+        if not tone:
+            tone = "as originally specified"
+        
+        # Emit refinement_start signal to clear display and disable buttons
+        refinement_start_signal = parent_window.refinement_start if hasattr(parent_window, 'refinement_start') else None
+        if refinement_start_signal:
+            refinement_start_signal.emit()
+        
+        # Generate refinement prompt WITH FULL SYNOPSIS CONTEXT
         refinement_prompt = (
             f"Refine this synopsis based on the following feedback:\n\n"
             f"ORIGINAL SYNOPSIS:\n{self.synopsis}\n\n"
@@ -590,15 +1489,13 @@ class BackgroundThread(QtCore.QThread):
         self.log_update.emit(f"[DEBUG] Refinement prompt length: {len(refinement_prompt)} characters")
         self.log_update.emit(f"[DEBUG] Tone being used: {tone[:50]}..." if len(tone) > 50 else f"[DEBUG] Tone being used: {tone}")
         self.log_update.emit("Starting synopsis refinement with user feedback...")
-        refined_synopsis = ''
-        refinement_token_count = 0
-        
         # Use retry helper for refinement
         refinement_stream = self._generate_with_retry(
             parent_window,
             model=self.llm_model,
             prompt=refinement_prompt,
-            max_retries=3
+            max_retries=3,
+            use_cache=True
         )
         
         if refinement_stream is None:
@@ -606,74 +1503,111 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Stream refined tokens in REAL-TIME for live display updates
-        for chunk in refinement_stream:
-            try:
-                # Check for pause
-                self.wait_while_paused()
-                
-                # Handle both dict and GenerateResponse object formats
-                token = None
-                
-                if isinstance(chunk, dict) and 'response' in chunk:
-                    token = chunk['response']
-                elif hasattr(chunk, 'response'):
-                    token = chunk.response  # type: ignore
-                
-                if token:
-                    refined_synopsis += token
-                    refinement_token_count += 1
-                    
-                    # EMIT EVERY TOKEN for live streaming (this is key!)
-                    # Handler checks if new_length > current_length to detect updates
-                    self.new_synopsis.emit(refined_synopsis)
-                    
-                    # Log every 100 tokens to avoid spam
-                    if refinement_token_count % 100 == 0:
-                        self.log_update.emit(f"[Feedback Refinement] {refinement_token_count} tokens received...")
-            
-            except Exception as e:
-                self.log_update.emit(f"Warning: Error processing refinement chunk: {str(e)}")
-                continue
+        # Handler checks if new_length > current_length to detect updates; each emit carries
+        # the full text, so flush on the 25 ms clock only - never faster on quick token bursts
+        refined_synopsis, refinement_token_count, refined_word_count = self._consume_stream(
+            refinement_stream, self._cumulative_emitter(self.new_synopsis), 'Feedback Refinement', min_tokens=None
+        )
         
         # Final update with complete refined synopsis
         if refined_synopsis:
             self.synopsis = refined_synopsis
-            refined_word_count = len(self.synopsis.split())
             
             # Save refined synopsis to refined_synopsis.txt
-            project_path = parent_window.current_project['path']
+            project_path = ctx.project_path
             refined_synopsis_path = os.path.join(project_path, 'refined_synopsis.txt')
-            with open(refined_synopsis_path, 'w', encoding='utf-8') as f:
-                f.write(self.synopsis)
+            _atomic_write(refined_synopsis_path, self.synopsis)
             
             self.log_update.emit(f"Synopsis refinement complete: {refined_word_count} words ({refinement_token_count} tokens)")
             
-            # Final emit for consistency (already emitted all tokens, but ensure complete state)
+            # Final emit so the UI sees tokens still pending in the last batch
             self.new_synopsis.emit(self.synopsis)
     
-    def generate_outline(self, content_type):
-        """Generate detailed 25-chapter outline based on approved synopsis. Only processes 'synopsis' type."""
-        if content_type != 'synopsis':
-            return
+    def _run_stage(self, ctx, spec, stream):
+        """Stream one outline/characters/world stage into its display and file.
         
-        # Get parent window to access tone, target, client and project
-        parent = self.parent()
-        if not parent or not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for outline generation")
+        Args:
+            ctx: _ProjectContext from _project_context
+            spec: _StageSpec describing the stage's signal, file and messages
+            stream: Iterator from _generate_with_retry/_refinement_stream, or None
+        """
+        if stream is None:
+            self.log_update.emit(spec.retry_failed)
             return
         
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for outline generation")
-            return
+        signal = getattr(self, spec.signal)
+        try:
+            # Stream tokens for live display, emitting in growing batches
+            text, token_count, word_count = self._stream_and_emit(
+                stream, signal, spec.label,
+                save_path=os.path.join(ctx.project_path, spec.filename),
+                header=spec.header, footer=spec.footer
+            )
+            
+            if text:
+                self.log_update.emit(f"{spec.label.capitalize()} complete: {word_count} words ({token_count} tokens)")
+                
+                # Final emit for consistency
+                signal.emit(text)
+                
+                # Save progress: stage ready for approval
+                if spec.progress_stage:
+                    ctx.window._save_progress(spec.progress_stage, 'ready_for_approval')
+            elif spec.empty_warning:
+                self.log_update.emit(spec.empty_warning)
         
+        except Exception as e:
+            self.log_update.emit(f"{spec.label.capitalize()} error: {str(e)}")
+    
+    def _require_synopsis(self, ctx, purpose):
+        """Load the synopsis if needed. Returns False (after logging) when none is available."""
         if not self.synopsis:
-            # Try to load synopsis from project files
-            self.load_synopsis_from_project(parent_window.current_project['path'])
-        
+            self.load_synopsis_from_project(ctx.project_path)
         if not self.synopsis:
-            self.log_update.emit("Error: No synopsis available for outline generation")
+            self.log_update.emit(f"Error: No synopsis available for {purpose}")
+            return False
+        return True
+    
+    def _read_outline(self, ctx):
+        """Return outline.txt for stages built on the approved outline, or None (after logging)."""
+        try:
+            with open(os.path.join(ctx.project_path, 'outline.txt'), 'r', encoding='utf-8') as f:
+                outline_content = f.read()
+        except Exception as e:
+            self.log_update.emit(f"Error reading outline: {str(e)}")
+            return None
+        
+        if not outline_content.strip():
+            self.log_update.emit("Error: Outline is empty")
+            return None
+        return outline_content
+    
+    def _current_content(self, ctx, display_attr, filename):
+        """Return the content being refined - the display's text if any, else the saved file."""
+        display = getattr(ctx.window, display_attr, None)
+        content = display.toPlainText().strip() if display is not None else ''
+        if content:
+            return content
+        
+        try:
+            with open(os.path.join(ctx.project_path, filename), 'r', encoding='utf-8') as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            return ''
+        except Exception as e:
+            self.log_update.emit(f"Warning: Could not load {filename}: {str(e)}")
+            return ''
+    
+    def generate_outline(self, content_type):
+        """Generate detailed 25-chapter outline based on approved synopsis. Only processes 'synopsis' type."""
+        if content_type != 'synopsis':
+            return
+        
+        # Get parent window to access tone, target, client and project
+        ctx = self._project_context('outline generation')
+        if ctx is None or not self._require_synopsis(ctx, 'outline generation'):
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Get tone from the novel idea inputs
         tone = ""
@@ -693,18 +1627,9 @@ class BackgroundThread(QtCore.QThread):
                 soft_target = 5000
         
         # Generate outline prompt
-        outline_prompt = (
-            f"Create a detailed outline for a novel with soft target {soft_target} words based on this synopsis: \"{self.synopsis}\". "
-            f"Include: 25 chapters with titles, 100–200-word summaries per chapter, key events, character developments, "
-            f"dynamic chapter lengths (5000–15000 words) based on pacing. "
-            f"Tone: \"{tone}\". "
-            f"Ensure no contradictions. "
-            f"Return ONLY the outline structure, no explanation or preamble."
-        )
+        outline_prompt = OUTLINE_PROMPT.substitute(target=soft_target, synopsis=self.synopsis, tone=tone)
         
         self.log_update.emit("Starting outline generation based on approved synopsis...")
-        outline_text = ''
-        outline_token_count = 0
         
         # Use retry helper for outline generation
         outline_stream = self._generate_with_retry(
@@ -713,64 +1638,7 @@ class BackgroundThread(QtCore.QThread):
             prompt=outline_prompt,
             max_retries=3
         )
-        
-        if outline_stream is None:
-            self.log_update.emit("Failed to generate outline after retries")
-            return
-        
-        try:
-            # Stream outline tokens in REAL-TIME for live display updates
-            for chunk in outline_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        outline_text += token
-                        outline_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_outline.emit(outline_text)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if outline_token_count % 100 == 0:
-                            self.log_update.emit(f"[Outline Generation] {outline_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing outline chunk: {str(e)}")
-                    continue
-            
-            # Final processing with completed outline
-            if outline_text:
-                project_path = parent_window.current_project['path']
-                outline_path = os.path.join(project_path, 'outline.txt')
-                with open(outline_path, 'w', encoding='utf-8') as f:
-                    f.write("=== NOVEL OUTLINE (25 CHAPTERS) ===\n\n")
-                    f.write(outline_text)
-                    f.write("\n\n=== END OUTLINE ===\n")
-                
-                outline_word_count = len(outline_text.split())
-                self.log_update.emit(f"Outline generation complete: {outline_word_count} words ({outline_token_count} tokens)")
-                
-                # Final emit for consistency
-                self.new_outline.emit(outline_text)
-                
-                # Save progress: outline ready for approval
-                if isinstance(parent_window, QtWidgets.QMainWindow):
-                    parent_window._save_progress('outline', 'ready_for_approval')
-            else:
-                self.log_update.emit("Warning: No outline text generated")
-        
-        except Exception as e:
-            self.log_update.emit(f"Outline generation error: {str(e)}")
+        self._run_stage(ctx, _STAGE_SPECS['generate_outline'], outline_stream)
     
     def refine_outline_with_feedback(self, content_type, feedback):
         """Refine outline based on user feedback. Only processes 'outline' type."""
@@ -778,53 +1646,20 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for outline refinement")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for outline refinement")
-            return
-        
-        if not self.synopsis:
-            self.load_synopsis_from_project(parent_window.current_project['path'])
-        
-        if not self.synopsis:
-            self.log_update.emit("Error: No synopsis available for outline refinement")
+        ctx = self._project_context('outline refinement')
+        if ctx is None or not self._require_synopsis(ctx, 'outline refinement'):
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Load the current outline for context
-        current_outline = ""
-        if hasattr(parent_window, 'outline_display'):
-            current_outline = parent_window.outline_display.toPlainText().strip()
-        
-        if not current_outline:
-            # Try loading from file
-            outline_file = os.path.join(parent_window.current_project['path'], 'outline.txt')
-            if os.path.exists(outline_file):
-                try:
-                    with open(outline_file, 'r', encoding='utf-8') as f:
-                        current_outline = f.read().strip()
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Could not load outline from file: {str(e)}")
-        
+        current_outline = self._current_content(ctx, 'outline_display', 'outline.txt')
         if not current_outline:
             self.log_update.emit("Error: No outline available for refinement")
             return
         
         # Generate outline refinement prompt WITH FULL CONTEXT
-        refinement_prompt = (
-            f"Refine this novel outline based on the following feedback:\n\n"
-            f"SYNOPSIS:\n{self.synopsis}\n\n"
-            f"CURRENT OUTLINE:\n{current_outline}\n\n"
-            f"USER FEEDBACK:\n{feedback}\n\n"
-            f"INSTRUCTIONS:\n"
-            f"- Incorporate the feedback while maintaining story coherence\n"
-            f"- Keep the overall structure and tone\n"
-            f"- Ensure chapters still align with the synopsis\n"
-            f"- Return ONLY the revised outline, no explanation or preamble."
+        refinement_prompt = OUTLINE_REFINE_PROMPT.substitute(
+            prefix=self._context_prefix(), outline=current_outline, feedback=feedback
         )
         
         self.log_update.emit("Starting outline refinement with user feedback...")
@@ -834,68 +1669,9 @@ class BackgroundThread(QtCore.QThread):
         if outline_refinement_signal:
             outline_refinement_signal.emit()
         
-        refined_outline = ''
-        outline_token_count = 0
-        
-        # Use retry helper for outline refinement
-        refinement_stream = self._generate_with_retry(
-            parent_window,
-            model=self.llm_model,
-            prompt=refinement_prompt,
-            max_retries=3
-        )
-        
-        if refinement_stream is None:
-            self.log_update.emit("Failed to refine outline after retries")
-            return
-        
-        try:
-            # Stream refined tokens in REAL-TIME for live display updates
-            for chunk in refinement_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        refined_outline += token
-                        outline_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_outline.emit(refined_outline)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if outline_token_count % 100 == 0:
-                            self.log_update.emit(f"[Outline Refinement] {outline_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing outline refinement chunk: {str(e)}")
-                    continue
-            
-            # Final processing with refined version
-            if refined_outline:
-                project_path = parent_window.current_project['path']
-                outline_path = os.path.join(project_path, 'outline.txt')
-                with open(outline_path, 'w', encoding='utf-8') as f:
-                    f.write("=== NOVEL OUTLINE (25 CHAPTERS - REFINED) ===\n\n")
-                    f.write(refined_outline)
-                    f.write("\n\n=== END OUTLINE ===\n")
-                
-                refined_word_count = len(refined_outline.split())
-                self.log_update.emit(f"Outline refinement complete: {refined_word_count} words ({outline_token_count} tokens)")
-                
-                # Final emit for consistency
-                self.new_outline.emit(refined_outline)
-        
-        except Exception as e:
-            self.log_update.emit(f"Outline refinement error: {str(e)}")
+        # Paraphrased feedback on unchanged content replays the earlier refinement
+        refinement_stream = self._refinement_stream(parent_window, refinement_prompt, 'outline', current_outline, feedback)
+        self._run_stage(ctx, _STAGE_SPECS['refine_outline'], refinement_stream)
     
     def generate_characters(self, content_type):
         """Generate detailed character profiles based on outline. Only processes 'outline' type."""
@@ -903,52 +1679,19 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access outline, client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for character generation")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for character generation")
-            return
-        
-        # Get outline from file
-        project_path = parent_window.current_project['path']
-        outline_path = os.path.join(project_path, 'outline.txt')
-        
-        try:
-            with open(outline_path, 'r', encoding='utf-8') as f:
-                outline_content = f.read()
-        except Exception as e:
-            self.log_update.emit(f"Error reading outline: {str(e)}")
-            return
-        
-        if not outline_content.strip():
-            self.log_update.emit("Error: Outline is empty")
+        ctx = self._project_context('character generation')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
-        # Get synopsis for context
-        if not self.synopsis:
-            # Try to load synopsis from project files
-            self.load_synopsis_from_project(project_path)
-        
-        if not self.synopsis:
-            self.log_update.emit("Error: No synopsis available for character generation")
+        outline_content = self._read_outline(ctx)
+        if outline_content is None or not self._require_synopsis(ctx, 'character generation'):
             return
         
         # Generate character profiles prompt
-        character_prompt = (
-            f"Generate detailed profiles for main characters in this outline: \"{outline_content}\". "
-            f"Include: Name, Age, Background, Traits, Arc, Relationships. "
-            f"Format as JSON array of character objects. "
-            f"Ensure consistency with synopsis: \"{self.synopsis}\". "
-            f"Return ONLY the JSON array, no explanation or preamble."
-        )
+        character_prompt = CHARACTERS_PROMPT.substitute(prefix=self._context_prefix(outline_content))
         
         self.log_update.emit("Starting character generation based on approved outline...")
-        characters_json = ''
-        character_token_count = 0
         
         character_stream = self._generate_with_retry(
             parent_window,
@@ -957,63 +1700,15 @@ class BackgroundThread(QtCore.QThread):
             max_retries=3
         )
         
-        if character_stream is None:
-            self.log_update.emit("Failed to generate characters after retries")
-            return
+        self._run_stage(ctx, _STAGE_SPECS['generate_characters'], character_stream)
         
-        try:
-            
-            # Stream character tokens in REAL-TIME for live display updates
-            for chunk in character_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        characters_json += token
-                        character_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_characters.emit(characters_json)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if character_token_count % 100 == 0:
-                            self.log_update.emit(f"[Character Generation] {character_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing character chunk: {str(e)}")
-                    continue
-            
-            # Final processing with completed characters
-            if characters_json:
-                characters_path = os.path.join(project_path, 'characters.txt')
-                with open(characters_path, 'w', encoding='utf-8') as f:
-                    f.write("=== MAIN CHARACTERS (JSON) ===\n\n")
-                    f.write(characters_json)
-                    f.write("\n\n=== END CHARACTERS ===\n")
-                
-                character_word_count = len(characters_json.split())
-                self.log_update.emit(f"Character generation complete: {character_word_count} words ({character_token_count} tokens)")
-                
-                # Final emit for consistency
-                self.new_characters.emit(characters_json)
-                
-                # Save progress: characters ready for approval
-                if isinstance(parent_window, QtWidgets.QMainWindow):
-                    parent_window._save_progress('characters', 'ready_for_approval')
-            else:
-                self.log_update.emit("Warning: No character data generated")
-        
-        except Exception as e:
-            self.log_update.emit(f"Character generation error: {str(e)}")
+        if character_stream is not None and self.reuse_responses:
+            # World-building only depends on the synopsis and outline, so generate it while
+            # the user reviews the characters - started only now so it never competes with
+            # the character stream for the model. generate_world replays it from the cache
+            cancel = threading.Event()
+            future = self._prefetch_exec.submit(self._prefetch_world, parent_window, outline_content, cancel)
+            self._world_prefetch = (future, cancel)
     
     def refine_characters_with_feedback(self, content_type, feedback):
         """Refine character profiles based on user feedback. Only processes 'characters' type."""
@@ -1021,226 +1716,128 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for character refinement")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for character refinement")
+        ctx = self._project_context('character refinement')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Ensure we have the synopsis context
         if not self.synopsis:
-            self.load_synopsis_from_project(parent_window.current_project['path'])
-        
-        # Get current characters from file or display
-        project_path = parent_window.current_project['path']
-        characters_content = ""
-        
-        # Try to get from display first
-        if hasattr(parent_window, 'characters_display'):
-            characters_content = parent_window.characters_display.toPlainText().strip()
-        
-        # If not in display, read from file
-        if not characters_content:
-            characters_path = os.path.join(project_path, 'characters.txt')
-            try:
-                with open(characters_path, 'r', encoding='utf-8') as f:
-                    characters_content = f.read().strip()
-            except Exception as e:
-                self.log_update.emit(f"Error reading characters: {str(e)}")
-                return
+            self.load_synopsis_from_project(ctx.project_path)
         
+        # Get current characters from display or file
+        characters_content = self._current_content(ctx, 'characters_display', 'characters.txt')
         if not characters_content:
             self.log_update.emit("Error: Characters are empty")
             return
         
         # Generate character refinement prompt WITH FULL CONTEXT
-        refinement_prompt = (
-            f"Refine the character profiles based on the following feedback:\n\n"
-            f"SYNOPSIS:\n{self.synopsis}\n\n"
-            f"CURRENT CHARACTERS:\n{characters_content}\n\n"
-            f"USER FEEDBACK:\n{feedback}\n\n"
-            f"INSTRUCTIONS:\n"
-            f"- Incorporate feedback while maintaining consistency with synopsis\n"
-            f"- Keep character arcs and relationships coherent\n"
-            f"- Ensure character depth matches story requirements\n"
-            f"- Return ONLY valid JSON array of character objects, no explanation or preamble."
+        refinement_prompt = CHARACTERS_REFINE_PROMPT.substitute(
+            prefix=self._context_prefix(), characters=characters_content, feedback=feedback
         )
         
         self.log_update.emit("Starting character refinement with user feedback...")
         
-        refined_characters = ''
-        characters_token_count = 0
-        
-        refinement_stream = self._generate_with_retry(
-            parent_window,
-            model=self.llm_model,
-            prompt=refinement_prompt,
-            max_retries=3
-        )
+        # Paraphrased feedback on unchanged content replays the earlier refinement
+        refinement_stream = self._refinement_stream(parent_window, refinement_prompt, 'characters', characters_content, feedback)
+        self._run_stage(ctx, _STAGE_SPECS['refine_characters'], refinement_stream)
+    
+    def _world_prompt(self, outline_content):
+        """Build the world-building prompt shared by generate_world and _prefetch_world."""
+        return WORLD_PROMPT.substitute(prefix=self._context_prefix(outline_content))
+    
+    def _cancel_world_prefetch(self):
+        """Ask an in-flight _prefetch_world to drop its stream. Safe to call at any time."""
+        prefetch, self._world_prefetch = self._world_prefetch, None
+        if prefetch is not None:
+            prefetch[1].set()
+    
+    def _prefetch_world(self, parent_window, outline_content, cancel):
+        """Generate world-building into .llm_cache in the background. Runs on the prefetch worker.
         
-        if refinement_stream is None:
-            self.log_update.emit("Failed to refine characters after retries")
+        Nothing is shown until the user approves the characters; generate_world then
+        waits for this to finish and replays the cached response. Pause holds the
+        stream; setting cancel or an abort drops it uncached, also while paused.
+        Failures are logged and left for generate_world to retry normally.
+        """
+        prompt = self._world_prompt(outline_content)
+        cache_path = self._llm_cache_path(parent_window, self.llm_model, prompt)
+        client = getattr(parent_window, 'client', None)
+        if cache_path is None or client is None or os.path.exists(cache_path):
             return
         
         try:
-            
-            # Stream refined tokens in REAL-TIME for live display updates
-            for chunk in refinement_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        refined_characters += token
-                        characters_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_characters.emit(refined_characters)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if characters_token_count % 100 == 0:
-                            self.log_update.emit(f"[Character Refinement] {characters_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing character refinement chunk: {str(e)}")
-                    continue
-            
-            # Final processing with refined version
-            if refined_characters:
-                with open(characters_path, 'w', encoding='utf-8') as f:
-                    f.write("=== MAIN CHARACTERS (JSON - REFINED) ===\n\n")
-                    f.write(refined_characters)
-                    f.write("\n\n=== END CHARACTERS ===\n")
-                
-                refined_word_count = len(refined_characters.split())
-                self.log_update.emit(f"Character refinement complete: {refined_word_count} words ({characters_token_count} tokens)")
-                
-                # Final emit for consistency
-                self.new_characters.emit(refined_characters)
-        
+            stream = client.generate(
+                model=self.llm_model,
+                prompt=prompt,
+                stream=True,
+                options={'temperature': self.temperature},
+                keep_alive=_OLLAMA_KEEP_ALIVE
+            )
+            abort, pause = self._abort_event, self._pause_event
+            recorder = self._record_stream(stream, cache_path)
+            for _ in recorder:
+                # Hold the stream while paused, still noticing a cancel or abort
+                if not pause.is_set():
+                    while not pause.wait(_PAUSE_POLL_INTERVAL):
+                        if cancel.is_set() or abort.is_set():
+                            break
+                if cancel.is_set() or abort.is_set():
+                    # Closing the recorder before it completes skips the cache write;
+                    # closing the response stream drops the request on the Ollama side
+                    recorder.close()
+                    if hasattr(stream, 'close'):
+                        stream.close()
+                    self.log_update.emit("World-building prefetch cancelled")
+                    return
+            self.log_update.emit("World-building pre-generated while characters were reviewed")
         except Exception as e:
-            self.log_update.emit(f"Character refinement error: {str(e)}")
+            self.log_update.emit(f"Warning: World-building prefetch failed: {str(e)}")
     
     def generate_world(self, content_type):
         """Generate world-building details based on outline. Only processes 'characters' type."""
         if content_type != 'characters':
             return
         
-        # Get parent window to access outline, client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for world generation")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for world generation")
-            return
-        
-        # Get outline from file
-        project_path = parent_window.current_project['path']
-        outline_path = os.path.join(project_path, 'outline.txt')
-        
-        try:
-            with open(outline_path, 'r', encoding='utf-8') as f:
-                outline_content = f.read()
-        except Exception as e:
-            self.log_update.emit(f"Error reading outline: {str(e)}")
-            return
-        
-        if not outline_content.strip():
-            self.log_update.emit("Error: Outline is empty")
-            return
-        
-        # Generate world-building prompt
-        world_prompt = (
-            f"Generate world-building details for this outline: \"{outline_content}\". "
-            f"Include: Tech, Culture, Geography, History, Rules. "
-            f"Format as JSON dict. "
-            f"Align with tone and characters. "
-            f"Return ONLY the JSON dict, no explanation or preamble."
-        )
-        
-        self.log_update.emit("Starting world generation based on approved characters...")
-        world_json = ''
-        world_token_count = 0
-        
-        world_stream = self._generate_with_retry(
-            parent_window,
-            model=self.llm_model,
-            prompt=world_prompt,
-            max_retries=3
-        )
-        
-        if world_stream is None:
-            self.log_update.emit("Failed to generate world after retries")
-            return
-        
-        try:
-            
-            # Stream world tokens in REAL-TIME for live display updates
-            for chunk in world_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        world_json += token
-                        world_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_world.emit(world_json)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if world_token_count % 100 == 0:
-                            self.log_update.emit(f"[World Generation] {world_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing world chunk: {str(e)}")
-                    continue
-            
-            # Final processing with completed world
-            if world_json:
-                world_path = os.path.join(project_path, 'world.txt')
-                with open(world_path, 'w', encoding='utf-8') as f:
-                    f.write("=== WORLD BUILDING (JSON) ===\n\n")
-                    f.write(world_json)
-                    f.write("\n\n=== END WORLD ===\n")
-                
-                world_word_count = len(world_json.split())
-                self.log_update.emit(f"World generation complete: {world_word_count} words ({world_token_count} tokens)")
-                
-                # Final emit for consistency
-                self.new_world.emit(world_json)
-                
-                # Save progress: world ready for approval
-                if isinstance(parent_window, QtWidgets.QMainWindow):
-                    parent_window._save_progress('world', 'ready_for_approval')
-            else:
-                self.log_update.emit("Warning: No world data generated")
-        
-        except Exception as e:
-            self.log_update.emit(f"World generation error: {str(e)}")
+        # Get parent window to access outline, client and project
+        ctx = self._project_context('world generation')
+        if ctx is None:
+            return
+        
+        outline_content = self._read_outline(ctx)
+        if outline_content is None:
+            return
+        
+        # Generate world-building prompt
+        world_prompt = self._world_prompt(outline_content)
+        
+        self.log_update.emit("Starting world generation based on approved characters...")
+        
+        # Let an in-flight prefetch finish rather than sending the same request twice,
+        # up to _PREFETCH_WAIT_TIMEOUT; an abort or the timeout cancels it instead
+        prefetch, self._world_prefetch = self._world_prefetch, None
+        if prefetch is not None and not prefetch[0].done():
+            future, cancel = prefetch
+            self.log_update.emit("Waiting for pre-generated world-building to finish...")
+            deadline = time.monotonic() + _PREFETCH_WAIT_TIMEOUT
+            while not future.done():
+                if self._abort_event.is_set() or time.monotonic() >= deadline:
+                    # The prefetch drops its stream at its next chunk
+                    cancel.set()
+                    self.log_update.emit("World-building prefetch cancelled - generating directly")
+                    break
+                self.wait_while_paused()
+                _wait_futures((future,), timeout=1.0)
+        
+        # Cached when _prefetch_world already ran after character generation
+        world_stream = self._generate_with_retry(
+            ctx.window,
+            model=self.llm_model,
+            prompt=world_prompt,
+            max_retries=3,
+            use_cache=True
+        )
+        self._run_stage(ctx, _STAGE_SPECS['generate_world'], world_stream)
     
     def refine_world_with_feedback(self, content_type, feedback):
         """Refine world-building details based on user feedback. Only processes 'world' type."""
@@ -1248,117 +1845,30 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for world refinement")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for world refinement")
+        ctx = self._project_context('world refinement')
+        if ctx is None:
             return
         
         # Ensure we have the synopsis context
         if not self.synopsis:
-            self.load_synopsis_from_project(parent_window.current_project['path'])
+            self.load_synopsis_from_project(ctx.project_path)
         
         # Get current world from display or file
-        project_path = parent_window.current_project['path']
-        world_content = ""
-        
-        # Try to get from display first
-        if hasattr(parent_window, 'world_display'):
-            world_content = parent_window.world_display.toPlainText().strip()
-        
-        # If not in display, read from file
-        if not world_content:
-            world_path = os.path.join(project_path, 'world.txt')
-            try:
-                with open(world_path, 'r', encoding='utf-8') as f:
-                    world_content = f.read().strip()
-            except Exception as e:
-                self.log_update.emit(f"Error reading world: {str(e)}")
-                return
-        
+        world_content = self._current_content(ctx, 'world_display', 'world.txt')
         if not world_content:
             self.log_update.emit("Error: World is empty")
             return
         
         # Generate world refinement prompt WITH FULL CONTEXT
-        refinement_prompt = (
-            f"Refine the world-building details based on the following feedback:\n\n"
-            f"SYNOPSIS:\n{self.synopsis}\n\n"
-            f"CURRENT WORLD:\n{world_content}\n\n"
-            f"USER FEEDBACK:\n{feedback}\n\n"
-            f"INSTRUCTIONS:\n"
-            f"- Incorporate feedback while maintaining consistency with synopsis\n"
-            f"- Ensure world rules and magic systems remain coherent\n"
-            f"- Check for internal consistency and logical worldbuilding\n"
-            f"- Return ONLY valid JSON object with world details, no explanation or preamble."
+        refinement_prompt = WORLD_REFINE_PROMPT.substitute(
+            prefix=self._context_prefix(), world=world_content, feedback=feedback
         )
         
         self.log_update.emit("Starting world refinement with user feedback...")
         
-        refined_world = ''
-        world_token_count = 0
-        
-        refinement_stream = self._generate_with_retry(
-            parent_window,
-            model=self.llm_model,
-            prompt=refinement_prompt,
-            max_retries=3
-        )
-        
-        if refinement_stream is None:
-            self.log_update.emit("Failed to refine world after retries")
-            return
-        
-        try:
-            
-            # Stream refined tokens in REAL-TIME for live display updates
-            for chunk in refinement_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        refined_world += token
-                        world_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_world.emit(refined_world)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if world_token_count % 100 == 0:
-                            self.log_update.emit(f"[World Refinement] {world_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing world refinement chunk: {str(e)}")
-                    continue
-            
-            # Final processing with refined version
-            if refined_world:
-                with open(world_path, 'w', encoding='utf-8') as f:
-                    f.write("=== WORLD BUILDING (JSON - REFINED) ===\n\n")
-                    f.write(refined_world)
-                    f.write("\n\n=== END WORLD ===\n")
-                
-                refined_word_count = len(refined_world.split())
-                self.log_update.emit(f"World refinement complete: {refined_word_count} words ({world_token_count} tokens)")
-                
-                # Final emit for consistency
-                self.new_world.emit(refined_world)
-        
-        except Exception as e:
-            self.log_update.emit(f"World refinement error: {str(e)}")
+        # Paraphrased feedback on unchanged content replays the earlier refinement
+        refinement_stream = self._refinement_stream(ctx.window, refinement_prompt, 'world', world_content, feedback)
+        self._run_stage(ctx, _STAGE_SPECS['refine_world'], refinement_stream)
     
     def generate_timeline(self, content_type):
         """Generate timeline from outline. Only processes 'world' type."""
@@ -1366,18 +1876,13 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access outline, client, project, and tone
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for timeline generation")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for timeline generation")
+        ctx = self._project_context('timeline generation')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Get outline from file
-        project_path = parent_window.current_project['path']
+        project_path = ctx.project_path
         outline_path = os.path.join(project_path, 'outline.txt')
         
         try:
@@ -1393,11 +1898,8 @@ class BackgroundThread(QtCore.QThread):
         
         # Get tone from config for timeline context
         config_content = parent_window.current_project.get('config', '')
-        tone = 'Unknown'
-        for line in config_content.split('\n'):
-            if 'Tone:' in line:
-                tone = line.split('Tone:', 1)[1].strip()
-                break
+        tone_match = _TONE_RE.search(config_content)
+        tone = tone_match.group(1).strip() if tone_match else 'Unknown'
         
         # Generate timeline prompt
         timeline_prompt = (
@@ -1409,8 +1911,6 @@ class BackgroundThread(QtCore.QThread):
         )
         
         self.log_update.emit("Starting timeline generation from approved planning...")
-        timeline_text = ''
-        timeline_token_count = 0
         
         timeline_stream = self._generate_with_retry(
             parent_window,
@@ -1424,45 +1924,18 @@ class BackgroundThread(QtCore.QThread):
             return
         
         try:
+            # Clear the timeline display so streamed deltas start from an empty document
+            if hasattr(parent_window, 'timeline_refinement_start'):
+                parent_window.timeline_refinement_start.emit()
             
-            # Stream timeline tokens in REAL-TIME for live display updates
-            for chunk in timeline_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        timeline_text += token
-                        timeline_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_timeline.emit(timeline_text)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if timeline_token_count % 100 == 0:
-                            self.log_update.emit(f"[Timeline Generation] {timeline_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing timeline chunk: {str(e)}")
-                    continue
+            # Stream tokens for live display, appending at most every 50 ms
+            timeline_text, timeline_token_count, timeline_word_count = self._stream_throttled(timeline_stream, self.timeline_delta, 'Timeline Generation')
             
             # Final processing with completed timeline
             if timeline_text:
                 timeline_path = os.path.join(project_path, 'timeline.txt')
-                with open(timeline_path, 'w', encoding='utf-8') as f:
-                    f.write("=== NOVEL TIMELINE (WITH DATES, LOCATIONS, EVENTS) ===\n\n")
-                    f.write(timeline_text)
-                    f.write("\n\n=== END TIMELINE ===\n")
+                _atomic_write(timeline_path, timeline_text, _TIMELINE_HEADER, _TIMELINE_FOOTER)
                 
-                timeline_word_count = len(timeline_text.split())
                 self.log_update.emit(f"Timeline generation complete: {timeline_word_count} words ({timeline_token_count} tokens)")
                 
                 # Final emit for consistency
@@ -1479,22 +1952,18 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for timeline refinement")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for timeline refinement")
+        ctx = self._project_context('timeline refinement')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Ensure we have the synopsis context
         if not self.synopsis:
-            self.load_synopsis_from_project(parent_window.current_project['path'])
+            self.load_synopsis_from_project(ctx.project_path)
         
         # Get current timeline from display or file
-        project_path = parent_window.current_project['path']
+        project_path = ctx.project_path
+        timeline_path = os.path.join(project_path, 'timeline.txt')
         timeline_content = ""
         
         # Try to get from display first
@@ -1503,7 +1972,6 @@ class BackgroundThread(QtCore.QThread):
         
         # If not in display, read from file
         if not timeline_content:
-            timeline_path = os.path.join(project_path, 'timeline.txt')
             try:
                 with open(timeline_path, 'r', encoding='utf-8') as f:
                     timeline_content = f.read().strip()
@@ -1520,10 +1988,10 @@ class BackgroundThread(QtCore.QThread):
         if refinement_signal:
             refinement_signal.emit()
         
-        # Generate timeline refinement prompt WITH FULL CONTEXT
+        # Generate timeline refinement prompt WITH FULL CONTEXT - shared synopsis prefix first
         refinement_prompt = (
+            f"{self._context_prefix()}"
             f"Refine the timeline based on the following feedback:\n\n"
-            f"SYNOPSIS:\n{self.synopsis}\n\n"
             f"CURRENT TIMELINE:\n{timeline_content}\n\n"
             f"USER FEEDBACK:\n{feedback}\n\n"
             f"INSTRUCTIONS:\n"
@@ -1536,14 +2004,12 @@ class BackgroundThread(QtCore.QThread):
         
         self.log_update.emit("Starting timeline refinement with user feedback...")
         
-        refined_timeline = ''
-        timeline_token_count = 0
-        
         refinement_stream = self._generate_with_retry(
             parent_window,
             model=self.llm_model,
             prompt=refinement_prompt,
-            max_retries=3
+            max_retries=3,
+            use_cache=True
         )
         
         if refinement_stream is None:
@@ -1552,43 +2018,13 @@ class BackgroundThread(QtCore.QThread):
         
         try:
             
-            # Stream refined tokens in REAL-TIME for live display updates
-            for chunk in refinement_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        refined_timeline += token
-                        timeline_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming
-                        self.new_timeline.emit(refined_timeline)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if timeline_token_count % 100 == 0:
-                            self.log_update.emit(f"[Timeline Refinement] {timeline_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing timeline refinement chunk: {str(e)}")
-                    continue
+            # Stream tokens for live display, appending at most every 50 ms
+            refined_timeline, timeline_token_count, refined_word_count = self._stream_throttled(refinement_stream, self.timeline_delta, 'Timeline Refinement')
             
             # Final processing with refined version
             if refined_timeline:
-                with open(timeline_path, 'w', encoding='utf-8') as f:
-                    f.write("=== NOVEL TIMELINE (WITH DATES, LOCATIONS, EVENTS - REFINED) ===\n\n")
-                    f.write(refined_timeline)
-                    f.write("\n\n=== END TIMELINE ===\n")
+                _atomic_write(timeline_path, refined_timeline, _TIMELINE_REFINED_HEADER, _TIMELINE_FOOTER)
                 
-                refined_word_count = len(refined_timeline.split())
                 self.log_update.emit(f"Timeline refinement complete: {refined_word_count} words ({timeline_token_count} tokens)")
                 
                 # Final emit for consistency
@@ -1603,15 +2039,10 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access client and project
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for section refinement")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for section refinement")
+        ctx = self._project_context('section refinement')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Check if buffer has content
         if not self.buffer or not self.buffer.strip():
@@ -1620,12 +2051,12 @@ class BackgroundThread(QtCore.QThread):
         
         # Ensure we have the synopsis context for consistency
         if not self.synopsis:
-            self.load_synopsis_from_project(parent_window.current_project['path'])
+            self.load_synopsis_from_project(ctx.project_path)
         
-        # Generate section refinement prompt WITH FULL CONTEXT
+        # Generate section refinement prompt WITH FULL CONTEXT - shared synopsis prefix first
         refinement_prompt = (
+            f"{self._context_prefix()}"
             f"Refine this draft section based on the following feedback:\n\n"
-            f"SYNOPSIS:\n{self.synopsis}\n\n"
             f"CURRENT SECTION:\n{self.buffer}\n\n"
             f"USER FEEDBACK:\n{feedback}\n\n"
             f"INSTRUCTIONS:\n"
@@ -1637,14 +2068,13 @@ class BackgroundThread(QtCore.QThread):
         )
         
         self.log_update.emit(f"Starting section refinement with user feedback...")
-        refined_section = ''
-        section_token_count = 0
         
         refinement_stream = self._generate_with_retry(
             parent_window,
             model=self.llm_model,
             prompt=refinement_prompt,
-            max_retries=3
+            max_retries=3,
+            use_cache=True
         )
         
         if refinement_stream is None:
@@ -1653,133 +2083,42 @@ class BackgroundThread(QtCore.QThread):
         
         try:
             
-            # Stream refined tokens in REAL-TIME from main refinement phase
-            for chunk in refinement_stream:
-                try:
-                    # Check for pause
-                    self.wait_while_paused()
-                    
-                    # Handle both dict and GenerateResponse object formats
-                    token = None
-                    
-                    if isinstance(chunk, dict) and 'response' in chunk:
-                        token = chunk['response']
-                    elif hasattr(chunk, 'response'):
-                        token = chunk.response  # type: ignore
-                    
-                    if token:
-                        refined_section += token
-                        section_token_count += 1
-                        
-                        # EMIT EVERY TOKEN for live streaming during refinement
-                        self.new_draft.emit(refined_section)
-                        
-                        # Log every 100 tokens to avoid spam
-                        if section_token_count % 100 == 0:
-                            self.log_update.emit(f"[Section Refinement] {section_token_count} tokens received...")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Error processing section refinement chunk: {str(e)}")
-                    continue
+            # Stream tokens for live display, appending at most every 50 ms
+            self.draft_reset.emit()
+            refined_section, section_token_count, refined_word_count = self._stream_throttled(refinement_stream, self.draft_delta, 'Section Refinement')
             
-            # Re-polish the refined section via polishing prompts
+            # Re-polish the refined section in one pass covering flow and style
             if refined_section:
-                # Polish pass 1: Check flow and transitions
-                polish_prompt_1 = (
-                    f'Polish this section for flow and transitions: "{refined_section}". '
-                    f"Enhance narrative flow, improve transitions, maintain consistency. "
+                polish_prompt = (
+                    f'Polish this section: "{refined_section}". '
+                    f"Enhance narrative flow and improve transitions; check for overused words, "
+                    f"improve sentence variety and enhance prose quality. Maintain consistency. "
                     f"Return ONLY the polished section."
                 )
                 
-                polished_section = ''
-                polish_token_count_1 = 0
-                
-                polish_stream_1 = self._generate_with_retry(
+                polish_stream = self._generate_with_retry(
                     parent_window,
                     model=self.llm_model,
-                    prompt=polish_prompt_1,
+                    prompt=polish_prompt,
                     max_retries=3
                 )
                 
                 try:
-                    if polish_stream_1 is not None and hasattr(polish_stream_1, '__iter__'):
-                        for chunk in polish_stream_1:
-                            try:
-                                # Check for pause
-                                self.wait_while_paused()
-                                
-                                token = None
-                                if isinstance(chunk, dict) and 'response' in chunk:
-                                    token = chunk['response']
-                                elif hasattr(chunk, 'response'):
-                                    token = chunk.response  # type: ignore
-                                
-                                if token:
-                                    polished_section += token
-                                    polish_token_count_1 += 1
-                                    
-                                    # EMIT TOKENS from polish pass 1
-                                    self.new_draft.emit(polished_section)
-                            except Exception as e:
-                                continue
+                    if polish_stream is not None:
+                        self.draft_reset.emit()
+                        polished_section, polish_token_count, polish_word_count = self._stream_throttled(polish_stream, self.draft_delta, 'Section Polish')
                         
                         if polished_section:
                             refined_section = polished_section
-                            self.log_update.emit(f"Section polish pass 1 complete ({polish_token_count_1} tokens)")
-                
-                except Exception as e:
-                    self.log_update.emit(f"Warning: Polish pass 1 error: {str(e)}")
-                
-                # Polish pass 2: Vocabulary and style check
-                polish_prompt_2 = (
-                    f'Refine vocabulary and style: "{refined_section}". '
-                    f"Check for overused words, improve sentence variety, enhance prose quality. "
-                    f"Return ONLY the refined section."
-                )
-                
-                polished_section_2 = ''
-                polish_token_count_2 = 0
-                
-                polish_stream_2 = self._generate_with_retry(
-                    parent_window,
-                    model=self.llm_model,
-                    prompt=polish_prompt_2,
-                    max_retries=3
-                )
-                
-                try:
-                    if polish_stream_2 is not None and hasattr(polish_stream_2, '__iter__'):
-                        for chunk in polish_stream_2:
-                            try:
-                                # Check for pause
-                                self.wait_while_paused()
-                                
-                                token = None
-                                if isinstance(chunk, dict) and 'response' in chunk:
-                                    token = chunk['response']
-                                elif hasattr(chunk, 'response'):
-                                    token = chunk.response  # type: ignore
-                                
-                                if token:
-                                    polished_section_2 += token
-                                    polish_token_count_2 += 1
-                                    
-                                    # EMIT TOKENS from polish pass 2
-                                    self.new_draft.emit(polished_section_2)
-                            except Exception as e:
-                                continue
-                        
-                        if polished_section_2:
-                            refined_section = polished_section_2
-                            self.log_update.emit(f"Section polish pass 2 complete ({polish_token_count_2} tokens)")
+                            refined_word_count = polish_word_count
+                            self.log_update.emit(f"Section polish pass complete ({polish_token_count} tokens)")
                 
                 except Exception as e:
-                    self.log_update.emit(f"Warning: Polish pass 2 error: {str(e)}")
+                    self.log_update.emit(f"Warning: Polish pass error: {str(e)}")
                 
                 # Update buffer with refined section
                 self.buffer = refined_section
-                refined_word_count = len(refined_section.split())
-                self.log_update.emit(f"Section refinement complete: {refined_word_count} words ({section_token_count} tokens) + 2 polish passes")
+                self.log_update.emit(f"Section refinement complete: {refined_word_count} words ({section_token_count} tokens) + polish pass")
                 
                 # Final emit for consistency
                 self.new_draft.emit(refined_section)
@@ -1793,40 +2132,27 @@ class BackgroundThread(QtCore.QThread):
             return
         
         # Get parent window to access project and client
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for section approval")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for section approval")
+        ctx = self._project_context('section approval')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
         # Check if buffer has content
         if not self.buffer or not self.buffer.strip():
             self.log_update.emit("Error: No section content in buffer for approval")
             return
         
-        project_path = parent_window.current_project['path']
-        story_path = os.path.join(project_path, 'story.txt')
-        summaries_path = os.path.join(project_path, 'summaries.txt')
-        context_path = os.path.join(project_path, 'context.txt')
-        config_path = os.path.join(project_path, 'config.txt')
+        paths = _project_paths(ctx.project_path)
+        story_path = paths['story']
+        summaries_path = paths['summaries']
+        context_path = paths['context']
+        config_path = paths['config']
         
         try:
-            # Track current chapter and section numbers
-            current_chapter = 1
-            current_section = 1
-            
-            # Parse config to get current chapter and section
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.startswith('CurrentChapter:'):
-                            current_chapter = int(line.split(':')[1].strip())
-                        elif line.startswith('CurrentSection:'):
-                            current_section = int(line.split(':')[1].strip())
+            # Parse config once for chapter/section progress and the novel targets
+            config_data = dict(self._load_config(config_path))
+            current_chapter = int(config_data.get('CurrentChapter') or 1)
+            current_section = int(config_data.get('CurrentSection') or 1)
             
             # Determine if this is a new chapter (first section of chapter)
             is_new_chapter = (current_section == 1)
@@ -1836,12 +2162,12 @@ class BackgroundThread(QtCore.QThread):
             if is_new_chapter:
                 chapter_heading = f"\n\n=== CHAPTER {current_chapter} ===\n\n"
             
-            with open(story_path, 'a', encoding='utf-8') as f:
-                if is_new_chapter:
-                    f.write(chapter_heading)
-                f.write(self.buffer)
-                if not self.buffer.endswith('\n'):
-                    f.write('\n')
+            # One buffered writelines call for heading, section and trailing newline
+            story_chunks = [chapter_heading, self.buffer]
+            if not self.buffer.endswith('\n'):
+                story_chunks.append('\n')
+            with open(story_path, 'a', encoding='utf-8', buffering=64 * 1024) as f:
+                f.writelines(story_chunks)
             
             self.log_update.emit(f"Section {current_section} of Chapter {current_chapter} appended to story.txt")
             
@@ -1851,9 +2177,6 @@ class BackgroundThread(QtCore.QThread):
             
             self.log_update.emit(f"Generating summary for Section {current_section}...")
             
-            summary = ''
-            summary_token_count = 0
-            
             summary_stream = self._generate_with_retry(
                 parent_window,
                 model=self.llm_model,
@@ -1862,26 +2185,13 @@ class BackgroundThread(QtCore.QThread):
             )
             
             try:
-                if summary_stream is not None and hasattr(summary_stream, '__iter__'):
-                    for chunk in summary_stream:
-                        try:
-                            token = None
-                            if isinstance(chunk, dict) and 'response' in chunk:
-                                token = chunk['response']
-                            elif hasattr(chunk, 'response'):
-                                token = chunk.response  # type: ignore
-                            
-                            if token:
-                                summary += token
-                                summary_token_count += 1
-                        except Exception as e:
-                            continue
+                if summary_stream is not None:
+                    summary, summary_token_count, _ = self._consume_stream(summary_stream, None, 'Section Summary')
                     
                     if summary:
                         # Append to summaries.txt
-                        with open(summaries_path, 'a', encoding='utf-8') as f:
-                            f.write(f"Chapter {current_chapter}, Section {current_section}:\n")
-                            f.write(f"{summary}\n\n")
+                        with open(summaries_path, 'a', encoding='utf-8', buffering=64 * 1024) as f:
+                            f.writelines((f"Chapter {current_chapter}, Section {current_section}:\n", summary, "\n\n"))
                         
                         self.log_update.emit(f"Section summary generated and saved ({summary_token_count} tokens)")
             
@@ -1896,9 +2206,6 @@ class BackgroundThread(QtCore.QThread):
             
             self.log_update.emit(f"Extracting context (key events/mood) for Section {current_section}...")
             
-            context_update = ''
-            context_token_count = 0
-            
             context_stream = self._generate_with_retry(
                 parent_window,
                 model=self.llm_model,
@@ -1907,25 +2214,12 @@ class BackgroundThread(QtCore.QThread):
             )
             
             try:
-                if context_stream is not None and hasattr(context_stream, '__iter__'):
-                    for chunk in context_stream:
-                        try:
-                            token = None
-                            if isinstance(chunk, dict) and 'response' in chunk:
-                                token = chunk['response']
-                            elif hasattr(chunk, 'response'):
-                                token = chunk.response  # type: ignore
-                            
-                            if token:
-                                context_update += token
-                                context_token_count += 1
-                        except Exception as e:
-                            continue
+                if context_stream is not None:
+                    context_update, context_token_count, _ = self._consume_stream(context_stream, None, 'Context Extraction')
                     
                     if context_update:
                         # Append to context.txt
-                        with open(context_path, 'a', encoding='utf-8') as f:
-                            f.write(f"Chapter {current_chapter}, Section {current_section}: {context_update}\n")
+                        self._context_appender.write(context_path, f"Chapter {current_chapter}, Section {current_section}: {context_update}\n")
                         
                         self.log_update.emit(f"Context updated with events/mood ({context_token_count} tokens)")
             
@@ -1935,28 +2229,23 @@ class BackgroundThread(QtCore.QThread):
             # Update config with new section/chapter progress
             section_word_count = len(self.buffer.split())
             
-            # Read current config to get soft target and total chapters
-            config_data = {}
-            soft_target = 50000  # Default soft target
-            total_chapters = 25  # Default total chapters
-            
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if ':' in line:
-                            key, value = line.split(':', 1)
-                            config_data[key.strip()] = value.strip()
-                            if key.strip() == 'SoftTarget':
-                                soft_target = int(value.strip())
-                            elif key.strip() == 'TotalChapters':
-                                total_chapters = int(value.strip())
+            # Soft target and total chapters come from the config parsed above
+            soft_target = int(config_data.get('SoftTarget', 50000))  # Default soft target
+            total_chapters = int(config_data.get('TotalChapters', 25))  # Default total chapters
             
-            # Calculate current story word count
-            story_word_count = 0
-            if os.path.exists(story_path):
-                with open(story_path, 'r', encoding='utf-8') as f:
-                    story_content = f.read()
-                    story_word_count = len(story_content.split())
+            # Calculate current story word count from the running total kept in config, so
+            # approving a section costs O(section) instead of re-reading the whole story.
+            # Older projects without the key fall back to one line-by-line scan of story.txt.
+            if 'StoryWordCount' in config_data:
+                story_word_count = int(config_data['StoryWordCount'] or 0) + section_word_count
+            else:
+                story_word_count = 0
+                try:
+                    with open(story_path, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            story_word_count += len(line.split())
+                except FileNotFoundError:
+                    pass
             
             # Calculate progress percentage
             progress_percentage = (story_word_count / soft_target * 100) if soft_target > 0 else 0
@@ -1973,17 +2262,13 @@ class BackgroundThread(QtCore.QThread):
                 'CurrentChapter': next_chapter,
                 'CurrentSection': next_section_reset,
                 'SectionWords': section_word_count,
+                'StoryWordCount': story_word_count,
                 'Progress': f"{int(progress_percentage)}%"
             }
             
-            # Update with new values
+            # Update with new values - written once below, after any chapter adjustment
             config_data.update(config_updates)
             
-            # Write updated config
-            with open(config_path, 'w', encoding='utf-8') as f:
-                for key, value in config_data.items():
-                    f.write(f"{key}: {value}\n")
-            
             self.log_update.emit(f"Section {current_section} of Chapter {current_chapter} approved and processed ({section_word_count} words)")
             self.log_update.emit(f"Progress: {int(progress_percentage)}% ({story_word_count} / {soft_target} words)")
             
@@ -1996,9 +2281,7 @@ class BackgroundThread(QtCore.QThread):
                 self.log_update.emit(f"Milestone reached: {int(progress_percentage)}% complete. Prompting user for chapter extension...")
                 
                 # Get parent window to show dialog
-                if isinstance(parent, QtWidgets.QMainWindow):
-                    parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-                    
+                if isinstance(parent_window, QtWidgets.QMainWindow):
                     # Show dialog with two options
                     reply = QtWidgets.QMessageBox.question(
                         parent_window,
@@ -2015,10 +2298,6 @@ class BackgroundThread(QtCore.QThread):
                         new_total = total_chapters + 5  # Add 5 more chapters
                         config_data['TotalChapters'] = new_total
                         
-                        with open(config_path, 'w', encoding='utf-8') as f:
-                            for key, value in config_data.items():
-                                f.write(f"{key}: {value}\n")
-                        
                         self.log_update.emit(f"Novel extended: Total chapters increased from {total_chapters} to {new_total}")
                         
                     else:
@@ -2026,12 +2305,11 @@ class BackgroundThread(QtCore.QThread):
                         new_total = current_chapter + 2  # Allow 2 more chapters for conclusion
                         config_data['TotalChapters'] = new_total
                         
-                        with open(config_path, 'w', encoding='utf-8') as f:
-                            for key, value in config_data.items():
-                                f.write(f"{key}: {value}\n")
-                        
                         self.log_update.emit(f"Novel wrapping up: Total chapters set to {new_total} for conclusion")
             
+            # Write progress and any TotalChapters change in a single config update
+            self._flush_config(config_path, config_data)
+            
             # Check if novel is complete
             if next_chapter > total_chapters:
                 self.log_update.emit(f"=== NOVEL COMPLETE ===")
@@ -2047,17 +2325,12 @@ class BackgroundThread(QtCore.QThread):
     def perform_final_consistency_check(self):
         """Perform final consistency check on completed novel against characters, world, and timeline."""
         # Get parent window to access project and client
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for consistency check")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for consistency check")
+        ctx = self._project_context('consistency check')
+        if ctx is None:
             return
+        parent_window: 'ANSWindow' = ctx.window
         
-        project_path = parent_window.current_project['path']
+        project_path = ctx.project_path
         story_path = os.path.join(project_path, 'story.txt')
         characters_path = os.path.join(project_path, 'characters.txt')
         world_path = os.path.join(project_path, 'world.txt')
@@ -2072,19 +2345,19 @@ class BackgroundThread(QtCore.QThread):
             
             if os.path.exists(story_path):
                 with open(story_path, 'r', encoding='utf-8') as f:
-                    story_content = f.read()[:5000]  # Limit to first 5000 chars for analysis
+                    story_content = f.read(5000)  # Limit to first 5000 chars for analysis
             
             if os.path.exists(characters_path):
                 with open(characters_path, 'r', encoding='utf-8') as f:
-                    characters_content = f.read()[:2000]
+                    characters_content = f.read(2000)
             
             if os.path.exists(world_path):
                 with open(world_path, 'r', encoding='utf-8') as f:
-                    world_content = f.read()[:2000]
+                    world_content = f.read(2000)
             
             if os.path.exists(timeline_path):
                 with open(timeline_path, 'r', encoding='utf-8') as f:
-                    timeline_content = f.read()[:2000]
+                    timeline_content = f.read(2000)
             
             # Generate consistency check prompt
             consistency_prompt = (
@@ -2098,9 +2371,6 @@ class BackgroundThread(QtCore.QThread):
             
             self.log_update.emit("Starting final consistency check on completed novel...")
             
-            issues_found = ''
-            token_count = 0
-            
             check_stream = self._generate_with_retry(
                 parent_window,
                 model=self.llm_model,
@@ -2109,20 +2379,8 @@ class BackgroundThread(QtCore.QThread):
             )
             
             try:
-                if check_stream is not None and hasattr(check_stream, '__iter__'):
-                    for chunk in check_stream:
-                        try:
-                            token = None
-                            if isinstance(chunk, dict) and 'response' in chunk:
-                                token = chunk['response']
-                            elif hasattr(chunk, 'response'):
-                                token = chunk.response  # type: ignore
-                            
-                            if token:
-                                issues_found += token
-                                token_count += 1
-                        except Exception as e:
-                            continue
+                if check_stream is not None:
+                    issues_found, token_count, _ = self._consume_stream(check_stream, None, 'Consistency Check')
                     
                     if issues_found:
                         self.log_update.emit(f"Consistency check complete ({token_count} tokens)")
@@ -2133,9 +2391,7 @@ class BackgroundThread(QtCore.QThread):
                             self.log_update.emit("Issues detected. Prompting user for auto-fix option...")
                             
                             # Get parent window to show dialog
-                            if isinstance(parent, QtWidgets.QMainWindow):
-                                parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-                                
+                            if isinstance(parent_window, QtWidgets.QMainWindow):
                                 # Show dialog asking user if they want to auto-fix
                                 reply = QtWidgets.QMessageBox.question(
                                     parent_window,
@@ -2161,75 +2417,74 @@ class BackgroundThread(QtCore.QThread):
         except Exception as e:
             self.log_update.emit(f"Final consistency check error: {str(e)}")
     
-    def start_chapter_research_loop(self):
+    def start_chapter_research_loop(self, content_type=None):
         """Start chapter-by-chapter research notes generation loop after timeline approval."""
         # Get parent window to access project and config
-        parent = self.parent()
-        if not isinstance(parent, QtWidgets.QMainWindow):
-            self.log_update.emit("Error: No active window context for chapter research")
-            return
-        
-        parent_window: 'ANSWindow' = parent  # type: ignore[assignment]
-        if not hasattr(parent_window, 'current_project') or not parent_window.current_project:
-            self.log_update.emit("Error: No active project for chapter research")
+        ctx = self._project_context('chapter research')
+        if ctx is None:
             return
-        
-        project_path = parent_window.current_project['path']
-        config_path = os.path.join(project_path, 'config.txt')
+        parent_window: 'ANSWindow' = ctx.window
+        
+        project_path = ctx.project_path
+        # Resolve every per-project path once rather than per chapter/section
+        paths = _project_paths(project_path)
+        config_path = paths['config']
+        context_path = paths['context']
+        world_path = paths['world']
+        characters_path = paths['characters']
+        buffer_path = paths['buffer_backup']
         outline_path = os.path.join(project_path, 'outline.txt')
+        research_path = os.path.join(project_path, 'research_notes.txt')
+        timeline_path = os.path.join(project_path, 'timeline.txt')
+        drafts_dir = os.path.join(project_path, 'drafts')
         
         try:
-            # Read current chapter and outline
-            current_chapter = 1
-            total_chapters = 25
-            
-            # Parse config to get current chapter
-            if os.path.exists(config_path):
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.startswith('CurrentChapter:'):
-                            current_chapter = int(line.split(':')[1].strip())
-                        elif line.startswith('TotalChapters:'):
-                            total_chapters = int(line.split(':')[1].strip())
-            
-            # Read outline for reference
-            outline_text = ""
+            # Read current chapter and total chapters from the cached config
+            config_dict = self._load_config(config_path)
+            current_chapter = int(config_dict.get('CurrentChapter') or 1)
+            total_chapters = int(config_dict.get('TotalChapters') or 25)
+            
+            # Context heads shared by every research and draft prompt in this run -
+            # only the characters each prompt uses are read
+            outline_head = ""
             if os.path.exists(outline_path):
                 with open(outline_path, 'r', encoding='utf-8') as f:
-                    outline_text = f.read()
-            
-            # Get world and characters for context
-            world_text = ""
-            characters_text = ""
+                    outline_head = f.read(2000)
             
-            world_path = os.path.join(project_path, 'world.txt')
+            world_head = ""
             if os.path.exists(world_path):
                 with open(world_path, 'r', encoding='utf-8') as f:
-                    world_text = f.read()
+                    world_head = f.read(1000)
             
-            characters_path = os.path.join(project_path, 'characters.txt')
+            characters_head = ""
             if os.path.exists(characters_path):
                 with open(characters_path, 'r', encoding='utf-8') as f:
-                    characters_text = f.read()
+                    characters_head = f.read(1000)
+            
+            # The timeline does not change while the loop runs - read its head once
+            timeline_text = ""
+            if os.path.exists(timeline_path):
+                with open(timeline_path, 'r', encoding='utf-8') as f:
+                    timeline_text = f.read(1500)
+            
+            # context.txt is append-only, so its head is final once it holds 1500 characters
+            context_text = ""
             
             self.log_update.emit(f"Starting chapter-by-chapter research generation from Chapter {current_chapter} to {total_chapters}")
             
+            # Drafts for every chapter land in one directory - create it once per run
+            os.makedirs(drafts_dir, exist_ok=True)
+            
             # Begin chapter loop
             while current_chapter <= total_chapters:
                 self.log_update.emit(f"Generating research notes for Chapter {current_chapter}...")
                 
                 # Generate research notes for current chapter
-                research_prompt = (
-                    f"Generate 3-5 research points on topics relevant to Chapter {current_chapter} from outline, "
-                    f"e.g., hacking in dystopia. Based on world and characters. "
-                    f"\n\nOutline context:\n{outline_text[:2000]}\n\n"
-                    f"World context:\n{world_text[:1000]}\n\n"
-                    f"Characters context:\n{characters_text[:1000]}\n\n"
-                    f"Generate focused research points for Chapter {current_chapter}."
+                research_prompt = RESEARCH_PROMPT.substitute(
+                    chapter=current_chapter, outline=outline_head, world=world_head, characters=characters_head
                 )
                 
                 research_notes = ''
-                research_token_count = 0
                 
                 try:
                     research_stream = self._generate_with_retry(
@@ -2243,68 +2498,37 @@ class BackgroundThread(QtCore.QThread):
                         self.log_update.emit(f"Error: Failed to generate research notes for Chapter {current_chapter} after retries")
                         break
                     
-                    # Collect research tokens
-                    for chunk in research_stream:
-                        try:
-                            token = None
-                            
-                            if isinstance(chunk, dict) and 'response' in chunk:
-                                token = chunk['response']
-                            elif hasattr(chunk, 'response'):
-                                token = chunk.response  # type: ignore
-                            
-                            if token:
-                                research_notes += token
-                                research_token_count += 1
-                                
-                                # Log every 100 tokens
-                                if research_token_count % 100 == 0:
-                                    self.log_update.emit(f"[Chapter {current_chapter} Research] {research_token_count} tokens received...")
-                        
-                        except Exception as e:
-                            self.log_update.emit(f"Warning: Error processing research chunk: {str(e)}")
-                            continue
+                    # Collect research tokens - the reader thread binds the chunk extractor once
+                    research_notes, research_token_count, research_word_count = self._consume_stream(
+                        research_stream, None, f"Chapter {current_chapter} Research"
+                    )
                     
                     # Save research notes to file
                     if research_notes:
-                        research_path = os.path.join(project_path, 'research_notes.txt')
-                        
-                        # Append to research_notes.txt (or create if doesn't exist)
-                        mode = 'a' if os.path.exists(research_path) else 'w'
-                        with open(research_path, mode, encoding='utf-8') as f:
-                            if mode == 'w':
-                                f.write("=== RESEARCH NOTES FOR NOVEL CHAPTERS ===\n\n")
-                            f.write(f"--- Chapter {current_chapter} ---\n")
-                            f.write(research_notes)
-                            f.write(f"\n\n")
+                        # Append to research_notes.txt - exclusive create decides in the open itself
+                        # whether the file is new and needs its header
+                        try:
+                            f = open(research_path, 'x', encoding='utf-8')
+                            f.write("=== RESEARCH NOTES FOR NOVEL CHAPTERS ===\n\n")
+                        except FileExistsError:
+                            f = open(research_path, 'a', encoding='utf-8')
+                        with f:
+                            f.write(f"--- Chapter {current_chapter} ---\n{research_notes}\n\n")
                         
-                        research_word_count = len(research_notes.split())
                         self.log_update.emit(f"Chapter {current_chapter} research complete: {research_word_count} words ({research_token_count} tokens)")
                         
                         # Get tone and context for draft generation
-                        tone = ""
-                        context_text = ""
-                        timeline_text = ""
-                        
-                        config_dict = {}
-                        if os.path.exists(config_path):
-                            with open(config_path, 'r', encoding='utf-8') as f:
-                                for line in f:
-                                    if ':' in line:
-                                        key, value = line.split(':', 1)
-                                        config_dict[key.strip()] = value.strip()
-                                        if key.strip() == 'Tone':
-                                            tone = value.strip()
+                        config_dict = self._load_config(config_path)
+                        tone = config_dict.get('Tone', '')
                         
-                        context_path = os.path.join(project_path, 'context.txt')
-                        if os.path.exists(context_path):
-                            with open(context_path, 'r', encoding='utf-8') as f:
-                                context_text = f.read()[:1500]
-                        
-                        timeline_path = os.path.join(project_path, 'timeline.txt')
-                        if os.path.exists(timeline_path):
-                            with open(timeline_path, 'r', encoding='utf-8') as f:
-                                timeline_text = f.read()[:1500]
+                        # Re-read context only while approved sections can still change its head
+                        # (approvals may create context.txt mid-run, so open it rather than caching a stat)
+                        if len(context_text) < 1500:
+                            try:
+                                with open(context_path, 'r', encoding='utf-8') as f:
+                                    context_text = f.read(1500)
+                            except FileNotFoundError:
+                                pass
                         
                         # Draft generation for sections (default 5 sections per chapter)
                         current_section = 1
@@ -2314,24 +2538,23 @@ class BackgroundThread(QtCore.QThread):
                         except:
                             chapter_sections = 5
                         
+                        # buffer_backup refreshes run on the backup worker while the next prompt streams;
+                        # sharing it with the hourly backup serializes every write to that file
+                        pending_writes = []
                         for section_num in range(1, chapter_sections + 1):
                             self.log_update.emit(f"Generating draft for Chapter {current_chapter}, Section {section_num}...")
                             
                             # Build draft prompt with all context
-                            draft_prompt = (
-                                f"Write 500-1000 words for Chapter {current_chapter}, Section {section_num}. "
-                                f"\n\nUse:\n"
-                                f"Timeline: {timeline_text}\n\n"
-                                f"Research: {research_notes}\n\n"
-                                f"Tone: {tone}\n\n"
-                                f"Context: {context_text}\n\n"
-                                f"Characters: {characters_text[:1000]}\n\n"
-                                f"World: {world_text[:1000]}\n\n"
-                                f"Ensure engaging narrative, no plot holes."
+                            draft_prompt = DRAFT_PROMPT.substitute(
+                                chapter=current_chapter, section=section_num, timeline=timeline_text,
+                                research=research_notes, tone=tone, context=context_text,
+                                characters=characters_head, world=world_head
                             )
                             
                             draft_content = ''
                             draft_token_count = 0
+                            # Newest (content, header) for buffer_backup - written once per section
+                            section_backup = None
                             
                             draft_stream = self._generate_with_retry(
                                 parent_window,
@@ -2345,67 +2568,27 @@ class BackgroundThread(QtCore.QThread):
                                 continue
                             
                             try:
+                                # Stream the draft straight into drafts/chapter{}_section{}_v1.txt
+                                draft_filename = f"chapter{current_chapter}_section{section_num}_v1.txt"
+                                draft_path = os.path.join(drafts_dir, draft_filename)
+                                draft_content, draft_token_count, draft_word_count = self._stream_to_file(
+                                    draft_stream, f"Chapter {current_chapter} Section {section_num}", draft_path,
+                                    f"=== CHAPTER {current_chapter}, SECTION {section_num} ===\n\n"
+                                )
                                 
-                                # Collect draft tokens
-                                for chunk in draft_stream:
-                                    try:
-                                        token = None
-                                        
-                                        if isinstance(chunk, dict) and 'response' in chunk:
-                                            token = chunk['response']
-                                        elif hasattr(chunk, 'response'):
-                                            token = chunk.response  # type: ignore
-                                        
-                                        if token:
-                                            draft_content += token
-                                            draft_token_count += 1
-                                            
-                                            # Log every 100 tokens
-                                            if draft_token_count % 100 == 0:
-                                                self.log_update.emit(f"[Chapter {current_chapter} Section {section_num}] {draft_token_count} tokens received...")
-                                    
-                                    except Exception as e:
-                                        self.log_update.emit(f"Warning: Error processing draft chunk: {str(e)}")
-                                        continue
-                                
-                                # Save draft to file
                                 if draft_content:
-                                    # Create drafts directory if needed
-                                    drafts_dir = os.path.join(project_path, 'drafts')
-                                    if not os.path.exists(drafts_dir):
-                                        os.makedirs(drafts_dir)
-                                    
-                                    # Save to drafts/chapter{}_section{}_v1.txt
-                                    draft_filename = f"chapter{current_chapter}_section{section_num}_v1.txt"
-                                    draft_path = os.path.join(drafts_dir, draft_filename)
-                                    
-                                    with open(draft_path, 'w', encoding='utf-8') as f:
-                                        f.write(f"=== CHAPTER {current_chapter}, SECTION {section_num} ===\n\n")
-                                        f.write(draft_content)
-                                    
-                                    # Update buffer_backup with latest draft content
-                                    buffer_path = os.path.join(project_path, 'buffer_backup.txt')
-                                    with open(buffer_path, 'w', encoding='utf-8') as f:
-                                        f.write(f"=== LATEST DRAFT: Chapter {current_chapter}, Section {section_num} ===\n\n")
-                                        f.write(draft_content)
+                                    # buffer_backup will hold the latest draft content
+                                    section_backup = (draft_content, f"=== LATEST DRAFT: Chapter {current_chapter}, Section {section_num} ===\n\n")
                                     
                                     # Update project buffer
                                     parent_window.current_project['buffer_backup'] = draft_content
                                     
-                                    draft_word_count = len(draft_content.split())
                                     self.log_update.emit(f"Chapter {current_chapter} Section {section_num} draft complete: {draft_word_count} words ({draft_token_count} tokens)")
                                     
                                     # Polish the draft for coherence, depth, and tone alignment
                                     self.log_update.emit(f"Polishing draft for Chapter {current_chapter}, Section {section_num}...")
                                     
-                                    polish_prompt = (
-                                        f"Polish this draft: \"{draft_content}\" "
-                                        f"for coherence, depth, tone alignment. "
-                                        f"Flag areas for creativity, clarity, or vocabulary overuse. "
-                                        f"List top 5 overused words with suggestions. "
-                                        f"Check for contradictions with prior chapters. "
-                                        f"Return polished version with [FLAG: ...] markers for issues."
-                                    )
+                                    polish_prompt = DRAFT_POLISH_PROMPT.substitute(draft=draft_content)
                                     
                                     polished_content = ''
                                     polish_token_count = 0
@@ -2421,52 +2604,24 @@ class BackgroundThread(QtCore.QThread):
                                         if polish_stream is None:
                                             self.log_update.emit(f"Warning: Failed to polish draft for Chapter {current_chapter} Section {section_num} after retries")
                                         else:
-                                            # Collect polished tokens
-                                            for chunk in polish_stream:
-                                                try:
-                                                    token = None
-                                                    
-                                                    if isinstance(chunk, dict) and 'response' in chunk:
-                                                        token = chunk['response']
-                                                    elif hasattr(chunk, 'response'):
-                                                        token = chunk.response  # type: ignore
-                                                    
-                                                    if token:
-                                                        polished_content += token
-                                                        polish_token_count += 1
-                                                        
-                                                        # Log every 100 tokens
-                                                        if polish_token_count % 100 == 0:
-                                                            self.log_update.emit(f"[Chapter {current_chapter} Section {section_num} Polish] {polish_token_count} tokens received...")
-                                                
-                                                except Exception as e:
-                                                    self.log_update.emit(f"Warning: Error processing polish chunk: {str(e)}")
-                                                    continue
+                                            # Stream the polished version straight into v2
+                                            polished_filename = f"chapter{current_chapter}_section{section_num}_v2.txt"
+                                            polished_path = os.path.join(drafts_dir, polished_filename)
+                                            polished_content, polish_token_count, polished_word_count = self._stream_to_file(
+                                                polish_stream, f"Chapter {current_chapter} Section {section_num} Polish", polished_path,
+                                                f"=== CHAPTER {current_chapter}, SECTION {section_num} (POLISHED) ===\n\n"
+                                            )
                                             
                                             # Extract flags from polished content
-                                            flags = []
-                                            for line in polished_content.split('\n'):
-                                                if '[FLAG:' in line or 'overused words' in line.lower():
-                                                    flags.append(line.strip())
+                                            flags = [line.strip() for line in _FLAG_LINE_RE.findall(polished_content)]
                                             
-                                            # Save polished version to v2
                                             if polished_content:
-                                                polished_filename = f"chapter{current_chapter}_section{section_num}_v2.txt"
-                                                polished_path = os.path.join(drafts_dir, polished_filename)
-                                                
-                                                with open(polished_path, 'w', encoding='utf-8') as f:
-                                                    f.write(f"=== CHAPTER {current_chapter}, SECTION {section_num} (POLISHED) ===\n\n")
-                                                    f.write(polished_content)
-                                                
-                                                # Update buffer_backup with polished version
-                                                with open(buffer_path, 'w', encoding='utf-8') as f:
-                                                    f.write(f"=== LATEST DRAFT: Chapter {current_chapter}, Section {section_num} (POLISHED) ===\n\n")
-                                                    f.write(polished_content)
+                                                # buffer_backup will hold the polished version
+                                                section_backup = (polished_content, f"=== LATEST DRAFT: Chapter {current_chapter}, Section {section_num} (POLISHED) ===\n\n")
                                                 
                                                 # Update project buffer to polished version
                                                 parent_window.current_project['buffer_backup'] = polished_content
                                                 
-                                                polished_word_count = len(polished_content.split())
                                                 self.log_update.emit(f"Chapter {current_chapter} Section {section_num} polish complete: {polished_word_count} words ({polish_token_count} tokens)")
                                                 
                                                 # Log flags if found
@@ -2481,12 +2636,7 @@ class BackgroundThread(QtCore.QThread):
                                                         self.log_update.emit(f"Vocabulary issues detected. Enhancing draft with synonyms for Chapter {current_chapter}, Section {section_num}...")
                                                         
                                                         # Vocabulary enhancement prompt
-                                                        enhance_prompt = (
-                                                            f"Revise the draft: \"{polished_content}\" "
-                                                            f"by replacing overused words with synonyms from your suggestions. "
-                                                            f"Maintain flow and tone. "
-                                                            f"Return only the revised content, no explanation."
-                                                        )
+                                                        enhance_prompt = DRAFT_ENHANCE_PROMPT.substitute(draft=polished_content)
                                                         
                                                         enhanced_content = ''
                                                         enhance_token_count = 0
@@ -2500,46 +2650,21 @@ class BackgroundThread(QtCore.QThread):
                                                         
                                                         try:
                                                             if enhance_stream is not None:
-                                                                # Collect enhanced tokens
-                                                                for chunk in enhance_stream:
-                                                                    try:
-                                                                        token = None
-                                                                        
-                                                                        if isinstance(chunk, dict) and 'response' in chunk:
-                                                                            token = chunk['response']
-                                                                        elif hasattr(chunk, 'response'):
-                                                                            token = chunk.response  # type: ignore
-                                                                        
-                                                                        if token:
-                                                                            enhanced_content += token
-                                                                            enhance_token_count += 1
-                                                                            
-                                                                            # Log every 100 tokens
-                                                                            if enhance_token_count % 100 == 0:
-                                                                                self.log_update.emit(f"[Chapter {current_chapter} Section {section_num} Enhance] {enhance_token_count} tokens received...")
-                                                                    
-                                                                    except Exception as e:
-                                                                        self.log_update.emit(f"Warning: Error processing enhance chunk: {str(e)}")
-                                                                        continue
+                                                                # Stream the enhanced version straight into v3
+                                                                enhanced_filename = f"chapter{current_chapter}_section{section_num}_v3.txt"
+                                                                enhanced_path = os.path.join(drafts_dir, enhanced_filename)
+                                                                enhanced_content, enhance_token_count, enhanced_word_count = self._stream_to_file(
+                                                                    enhance_stream, f"Chapter {current_chapter} Section {section_num} Enhance", enhanced_path,
+                                                                    f"=== CHAPTER {current_chapter}, SECTION {section_num} (ENHANCED) ===\n\n"
+                                                                )
                                                                 
-                                                                # Save enhanced version to v3
                                                                 if enhanced_content:
-                                                                    enhanced_filename = f"chapter{current_chapter}_section{section_num}_v3.txt"
-                                                                    enhanced_path = os.path.join(drafts_dir, enhanced_filename)
-                                                                    
-                                                                    with open(enhanced_path, 'w', encoding='utf-8') as f:
-                                                                        f.write(f"=== CHAPTER {current_chapter}, SECTION {section_num} (ENHANCED) ===\n\n")
-                                                                        f.write(enhanced_content)
-                                                                    
-                                                                    # Update buffer_backup with enhanced version
-                                                                    with open(buffer_path, 'w', encoding='utf-8') as f:
-                                                                        f.write(f"=== LATEST DRAFT: Chapter {current_chapter}, Section {section_num} (ENHANCED) ===\n\n")
-                                                                        f.write(enhanced_content)
+                                                                    # buffer_backup will hold the enhanced version
+                                                                    section_backup = (enhanced_content, f"=== LATEST DRAFT: Chapter {current_chapter}, Section {section_num} (ENHANCED) ===\n\n")
                                                                     
                                                                     # Update project buffer to enhanced version
                                                                     parent_window.current_project['buffer_backup'] = enhanced_content
                                                                     
-                                                                    enhanced_word_count = len(enhanced_content.split())
                                                                     self.log_update.emit(f"Chapter {current_chapter} Section {section_num} vocabulary enhanced: {enhanced_word_count} words ({enhance_token_count} tokens)")
                                                                     
                                                                     # Log vocabulary improvements
@@ -2559,33 +2684,28 @@ class BackgroundThread(QtCore.QThread):
                             except Exception as e:
                                 self.log_update.emit(f"Error generating draft for Chapter {current_chapter} Section {section_num}: {str(e)}")
                                 continue
+                            finally:
+                                # One buffer_backup write per section, holding only its latest version
+                                if section_backup is not None:
+                                    pending_writes.append(self._backup_exec.submit(
+                                        _atomic_write, buffer_path, section_backup[0], section_backup[1].encode('utf-8')
+                                    ))
+                        
+                        # Let the chapter's buffer_backup writes land before reporting it
+                        for fut in _wait_futures(pending_writes).done:
+                            if fut.exception() is not None:
+                                self.log_update.emit(f"Error writing buffer backup for Chapter {current_chapter}: {fut.exception()}")
                         
                         # Emit draft signal if we have polished or draft content to display
-                        if 'buffer_backup' in parent_window.current_project and parent_window.current_project['buffer_backup']:
-                            self.new_draft.emit(parent_window.current_project['buffer_backup'])
+                        latest_draft = parent_window.current_project.get('buffer_backup')
+                        if latest_draft:
+                            self.new_draft.emit(latest_draft)
                         
                         # Update config with current chapter
                         current_chapter += 1
-                        config_lines = []
-                        if os.path.exists(config_path):
-                            with open(config_path, 'r', encoding='utf-8') as f:
-                                config_lines = f.readlines()
-                        
-                        # Update CurrentChapter
-                        updated = False
-                        for i, line in enumerate(config_lines):
-                            if line.startswith('CurrentChapter:'):
-                                config_lines[i] = f"CurrentChapter: {current_chapter}\n"
-                                updated = True
-                                break
-                        
-                        if not updated:
-                            config_lines.append(f"CurrentChapter: {current_chapter}\n")
-                        
-                        with open(config_path, 'w', encoding='utf-8') as f:
-                            f.writelines(config_lines)
-                        
-                        parent_window.current_project['config'] = ''.join(config_lines)
+                        config_dict = dict(self._load_config(config_path))
+                        config_dict['CurrentChapter'] = current_chapter
+                        parent_window.current_project['config'] = self._flush_config(config_path, config_dict)
                     else:
                         self.log_update.emit(f"Warning: No research notes generated for Chapter {current_chapter}")
                         break
@@ -2829,6 +2949,19 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
         # Store current loaded project for persistence during app runtime
         self.current_project = None
         
+        # Parsed progress.json per project path, keyed by file mtime
+        self._progress_cache = {}
+        
+        # Session app log stays open; buffered lines are flushed every few entries and on close
+        self._app_log_appender = LineAppender(flush_every=8)
+        
+        # Log lines waiting for the next batched append to the Logs tab
+        self._pending_log_lines = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_lines)
+        
         # Store references to expanded text widgets for streaming updates
         self.expanded_text_widgets = {}
         
@@ -2849,11 +2982,20 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
         self.thread.log_update.connect(self._on_log_update)
         self.thread.init_complete.connect(self._on_init_complete)
         self.thread.synopsis_ready.connect(self._on_synopsis_ready)
+        self.thread.synopsis_delta.connect(self._on_synopsis_delta)
         self.thread.new_synopsis.connect(self._on_new_synopsis)
         self.thread.new_outline.connect(self._on_new_outline)
         self.thread.new_characters.connect(self._on_new_characters)
         self.thread.new_world.connect(self._on_new_world)
         self.thread.new_timeline.connect(self._on_new_timeline)
+        # Acknowledge full-text snapshots after their handlers ran so the worker can
+        # drop intermediate ones instead of queueing them faster than they render
+        for snapshot_signal in (self.thread.new_synopsis, self.thread.new_outline,
+                                self.thread.new_characters, self.thread.new_world):
+            snapshot_signal.connect(self.thread.snapshot_drained)
+        self.thread.timeline_delta.connect(self._on_timeline_delta)
+        self.thread.draft_delta.connect(self._on_draft_delta)
+        self.thread.draft_reset.connect(self._on_draft_reset)
         
         # Initialize app settings and config
         self._initialize_app_config()
@@ -3718,6 +3860,19 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
         app_layout.addLayout(autoapproval_layout)
         app_layout.addWidget(autoapproval_info)
         
+        # Response reuse setting
+        reuse_layout = QtWidgets.QHBoxLayout()
+        reuse_label = QtWidgets.QLabel("Reuse LLM Responses:")
+        self.reuse_responses_checkbox = QtWidgets.QCheckBox()
+        self.reuse_responses_checkbox.setChecked(True)
+        reuse_info = QtWidgets.QLabel("(Replays an unused response once, e.g. after a failed step or pre-generated world)")
+        reuse_info.setStyleSheet("font-style: italic; color: #666;")
+        reuse_layout.addWidget(reuse_label)
+        reuse_layout.addWidget(self.reuse_responses_checkbox)
+        reuse_layout.addStretch()
+        app_layout.addLayout(reuse_layout)
+        app_layout.addWidget(reuse_info)
+        
         app_group.setLayout(app_layout)
         layout.addWidget(app_group)
         
@@ -3823,6 +3978,7 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
         self.autosave_spinbox.valueChanged.connect(self._save_settings)
         self.notifications_checkbox.stateChanged.connect(self._save_settings)
         self.autoapproval_checkbox.stateChanged.connect(self._save_settings)
+        self.reuse_responses_checkbox.stateChanged.connect(self._save_settings)
         self.max_retries_spinbox.valueChanged.connect(self._save_settings)
         self.detail_combo.currentTextChanged.connect(self._save_settings)
         self.char_depth_combo.currentTextChanged.connect(self._save_settings)
@@ -3943,7 +4099,7 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
                 icon = QtGui.QIcon(logo_path)
                 self.setWindowIcon(icon)
         except Exception as e:
-            print(f"Error setting window icon: {e}")
+            _log.warning("Error setting window icon: %s", e)
     
     def _set_dark_title_bar(self, is_dark_mode):
         """
@@ -3974,7 +4130,7 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
                     new_pixmap = new_pixmap.scaledToHeight(150, QtCore.Qt.TransformationMode.SmoothTransformation)
                     self.init_header_label.setPixmap(new_pixmap)
         except Exception as e:
-            print(f"Error refreshing header: {e}")
+            _log.warning("Error refreshing header: %s", e)
     
     def _on_temperature_changed(self, value):
         """Update temperature value label when slider changes."""
@@ -4010,6 +4166,8 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
     def closeEvent(self, event):
         """Save settings when the application closes."""
         self._save_settings()
+        self._app_log_appender.close()
+        self.thread.shutdown()
         event.accept()
     
     def _populate_ollama_models(self):
@@ -4101,7 +4259,7 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
                 if models:
                     return sorted(models)
         except Exception as e:
-            print(f"Error detecting Ollama models: {e}")
+            _log.warning("Error detecting Ollama models: %s", e)
         
         # Return empty list if detection fails
         return []
@@ -4132,6 +4290,9 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
                         elif 'AutoApproval:' in line:
                             autoapproval = line.split('AutoApproval:')[1].strip() == 'True'
                             self.autoapproval_checkbox.setChecked(autoapproval)
+                        elif 'ReuseResponses:' in line:
+                            reuse = line.split('ReuseResponses:')[1].strip() == 'True'
+                            self.reuse_responses_checkbox.setChecked(reuse)
                         elif 'MaxRetries:' in line:
                             max_retries = int(line.split('MaxRetries:')[1].strip())
                             self.max_retries_spinbox.setValue(max_retries)
@@ -4151,7 +4312,7 @@ class ANSWindow(_ANSWindowBase):  # type: ignore
                             sections = int(line.split('SectionsPerChapter:')[1].strip())
                             self.sections_spinbox.setValue(sections)
         except Exception as e:
-            print(f"Error loading settings: {e}")
+            _log.warning("Error loading settings: %s", e)
     
     def _save_settings(self):
         """Save application settings to config file."""
@@ -4168,6 +4329,7 @@ Temperature: {self.temperature_slider.value() / 100.0}
 AutoSave: {self.autosave_spinbox.value()}
 Notifications: {self.notifications_checkbox.isChecked()}
 AutoApproval: {self.autoapproval_checkbox.isChecked()}
+ReuseResponses: {self.reuse_responses_checkbox.isChecked()}
 MaxRetries: {self.max_retries_spinbox.value()}
 DetailLevel: {self.detail_combo.currentText().lower()}
 CharacterDepth: {self.char_depth_combo.currentText().lower()}
@@ -4178,7 +4340,7 @@ SectionsPerChapter: {self.sections_spinbox.value()}
             with open(config_path, 'w', encoding='utf-8') as f:
                 f.write(settings_content)
         except Exception as e:
-            print(f"Error saving settings: {e}")
+            _log.warning("Error saving settings: %s", e)
     
     def _on_init_complete(self):
         """Handle initialization complete signal from thread."""
@@ -4204,6 +4366,7 @@ SectionsPerChapter: {self.sections_spinbox.value()}
             self.thread.world_depth = self.world_depth_combo.currentText().lower()
             self.thread.quality_check = self.quality_combo.currentText().lower()
             self.thread.sections_per_chapter = self.sections_spinbox.value()
+            self.thread.reuse_responses = self.reuse_responses_checkbox.isChecked()
     
     def _refresh_logs_tab(self):
         """Refresh the logs tab with message about app logs location."""
@@ -4377,6 +4540,50 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         if hasattr(self, 'initial_adjust_button'):
             self.initial_adjust_button.setEnabled(True)
     
+    def _append_stream_delta(self, display_name, delta):
+        """Append newly streamed text at the end of a display and its expanded window, if open."""
+        display = getattr(self, display_name, None)
+        if display is not None:
+            # Check if user is at the bottom before appending
+            scrollbar = display.verticalScrollBar()
+            is_at_bottom = scrollbar is not None and scrollbar.value() == scrollbar.maximum()
+            
+            # Insert through a document cursor - O(len(delta)), no diff against the full text
+            cursor = QtGui.QTextCursor(display.document())
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.insertText(delta)
+            
+            # Only auto-scroll if user was already at the bottom
+            if is_at_bottom:
+                scrollbar.setValue(scrollbar.maximum())
+        
+        # Also update expanded window if it's open
+        if display_name in self.expanded_text_widgets:
+            expanded_text = self.expanded_text_widgets[display_name]
+            cursor = QtGui.QTextCursor(expanded_text.document())
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.insertText(delta)
+            expanded_text.setTextCursor(cursor)
+    
+    def _on_synopsis_delta(self, delta):
+        """Handle synopsis_delta signal. Append newly streamed text at the end of the display."""
+        self._append_stream_delta('synopsis_display', delta)
+    
+    def _on_timeline_delta(self, delta):
+        """Handle timeline_delta signal. Append newly streamed text at the end of the timeline display."""
+        self._append_stream_delta('timeline_display', delta)
+    
+    def _on_draft_delta(self, delta):
+        """Handle draft_delta signal. Append newly streamed text at the end of the draft display."""
+        self._append_stream_delta('draft_display', delta)
+    
+    def _on_draft_reset(self):
+        """Handle draft_reset signal. Clear the draft display before a new streamed pass."""
+        if hasattr(self, 'draft_display'):
+            self.draft_display.clear()
+        if 'draft_display' in self.expanded_text_widgets:
+            self.expanded_text_widgets['draft_display'].clear()
+    
     def _on_refinement_start(self):
         """Handle refinement start signal. Clear planning display and disable buttons during refinement."""
         if hasattr(self, 'planning_synopsis_display'):
@@ -4403,6 +4610,9 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         """Handle timeline refinement start signal. Clear timeline display and disable buttons during refinement."""
         if hasattr(self, 'timeline_display'):
             self.timeline_display.clear()
+        # Streamed deltas are appended to the expanded view too, so it starts empty as well
+        if 'timeline_display' in self.expanded_text_widgets:
+            self.expanded_text_widgets['timeline_display'].clear()
         
         # Disable timeline buttons during refinement - they'll be re-enabled when refinement completes
         if hasattr(self, 'approve_timeline_button'):
@@ -4593,6 +4803,8 @@ SectionsPerChapter: {self.sections_spinbox.value()}
                 cursor = self.timeline_display.textCursor()
                 cursor.movePosition(cursor.MoveOperation.Start)
                 self.timeline_display.setTextCursor(cursor)
+            if 'timeline_display' in self.expanded_text_widgets:
+                self.expanded_text_widgets['timeline_display'].setPlainText(timeline_text)
             
             # Enable timeline action buttons for user approval/adjustment
             if hasattr(self, 'approve_timeline_button'):
@@ -4608,9 +4820,21 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         # Write to rotating app log file
         self._write_app_log(log_message)
         
-        # Append to logs QTextEdit for UI display
+        # Queue for the Logs tab - lines are appended in batches, not one widget update each
+        self._pending_log_lines.append(log_entry.rstrip())
+        if len(self._pending_log_lines) >= _LOG_FLUSH_LINES:
+            self._flush_log_lines()
+        elif not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log_lines(self):
+        """Append all queued log lines to the Logs tab in a single update."""
+        self._log_flush_timer.stop()
+        if not self._pending_log_lines:
+            return
+        lines, self._pending_log_lines = self._pending_log_lines, []
         if hasattr(self, 'logs_text_edit'):
-            self.logs_text_edit.append(log_entry.rstrip())
+            self.logs_text_edit.append('\n'.join(lines))
     
     def _on_new_draft(self, draft_content):
         """Handle new_draft signal from background thread. Display draft in Writing tab."""
@@ -4648,7 +4872,8 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         if hasattr(self, 'draft_display'):
             content = self.draft_display.toPlainText().strip()
             if content and self.current_project:
-                self.buffer = content
+                # approve_section reads the section from the worker's buffer
+                self.thread.buffer = content
                 self.current_project['buffer_backup'] = content
         
         self.approve_signal.emit('section')
@@ -4942,18 +5167,9 @@ SectionsPerChapter: {self.sections_spinbox.value()}
             self.thread.start_processing({'refinement': True, 'type': content_type, 'feedback': feedback})
         else:
             # Thread is already running (active generation), call refinement directly
-            if content_type == 'synopsis':
-                self.thread.refine_synopsis_with_feedback(content_type, feedback)
-            elif content_type == 'outline':
-                self.thread.refine_outline_with_feedback(content_type, feedback)
-            elif content_type == 'characters':
-                self.thread.refine_characters_with_feedback(content_type, feedback)
-            elif content_type == 'world':
-                self.thread.refine_world_with_feedback(content_type, feedback)
-            elif content_type == 'timeline':
-                self.thread.refine_timeline_with_feedback(content_type, feedback)
-            elif content_type == 'section':
-                self.thread.refine_section_with_feedback(content_type, feedback)
+            handler = getattr(self.thread, BackgroundThread._REFINEMENT_HANDLERS.get(content_type, ''), None)
+            if handler is not None:
+                handler(content_type, feedback)
     
     def _on_approve_outline(self):
         """Handle Approve button click for outline - emit approve_signal with 'outline'."""
@@ -5270,10 +5486,9 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         try:
             if hasattr(self, 'current_app_log'):
                 log_entry = f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {message}\n"
-                with open(self.current_app_log, 'a', encoding='utf-8') as f:
-                    f.write(log_entry)
+                self._app_log_appender.write(self.current_app_log, log_entry)
         except Exception as e:
-            print(f"Failed to write to app log: {str(e)}")
+            _log.warning("Failed to write to app log: %s", e)
     
     def create_project_structure(self, project_path):
         """Create project-specific files and folders. Call when a new project is created."""
@@ -5285,40 +5500,22 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         # Create drafts folder
         os.makedirs(os.path.join(full_project_path, 'drafts'), exist_ok=True)
         
-        # List of project-specific files to create (empty)
-        empty_files = [
-            'story.txt',
-            'config.txt',
-            'context.txt',
-            'buffer_backup.txt'
-        ]
-        
-        # Create empty text files
-        for filename in empty_files:
-            filepath = os.path.join(full_project_path, filename)
-            if not os.path.exists(filepath):
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    pass
-        
-        # Create empty JSON files
-        json_files = ['characters.txt', 'world.txt']
-        for filename in json_files:
-            filepath = os.path.join(full_project_path, filename)
-            if not os.path.exists(filepath):
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    pass
-        
-        # Create progress tracking file
-        progress_file = os.path.join(full_project_path, 'progress.json')
-        if not os.path.exists(progress_file):
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f, indent=2)
+        # One directory scan instead of a stat per file
+        with os.scandir(full_project_path) as entries:
+            existing = {entry.name for entry in entries}
         
-        # Create summaries.txt (empty)
-        summaries_file = os.path.join(full_project_path, 'summaries.txt')
-        if not os.path.exists(summaries_file):
-            with open(summaries_file, 'w', encoding='utf-8') as f:
-                pass
+        # Create every project file in one pass; O_EXCL never truncates an existing file
+        for filename in [name for _, name in PROJECT_FILES] + ['progress.json']:
+            if filename in existing:
+                continue
+            try:
+                fd = os.open(os.path.join(full_project_path, filename), os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o644)
+            except FileExistsError:
+                continue
+            # Progress tracking starts as an empty JSON object; everything else starts empty
+            if filename == 'progress.json':
+                os.write(fd, b'{}\n')
+            os.close(fd)
         
         # Placeholders for backup files (not created yet)
         # story_backup.txt - placeholder
@@ -5334,27 +5531,25 @@ SectionsPerChapter: {self.sections_spinbox.value()}
             self._write_app_log(f"Project load failed: path not found - {project_path}")
             raise FileNotFoundError(f"Project '{project_name}' not found at {project_path}")
         
-        # Verify all required project files exist
-        required_files = ['story.txt', 'config.txt', 'context.txt', 
-                         'characters.txt', 'world.txt', 'summaries.txt', 'buffer_backup.txt']
-        for filename in required_files:
-            filepath = os.path.join(project_path, filename)
-            if not os.path.exists(filepath):
+        # Resolve each project file path once for both the check and the read
+        paths = _project_paths(project_path)
+        
+        # Verify all required project files exist (single directory scan)
+        with os.scandir(project_path) as entries:
+            existing = {entry.name for entry in entries}
+        for _, filename in PROJECT_FILES:
+            if filename not in existing:
                 self._write_app_log(f"Project load failed: missing file - {filename}")
                 raise FileNotFoundError(f"Project file missing: {filename}")
         
-        # Load and store project data in memory
+        # Load and store project data in memory. The worker and GUI threads both read
+        # this dict, so every field is filled in here rather than on first access
         self.current_project = {
             'name': project_name,
-            'path': project_path,
-            'story': self._read_file(os.path.join(project_path, 'story.txt')),
-            'config': self._read_file(os.path.join(project_path, 'config.txt')),
-            'context': self._read_file(os.path.join(project_path, 'context.txt')),
-            'characters': self._read_file(os.path.join(project_path, 'characters.txt')),
-            'world': self._read_file(os.path.join(project_path, 'world.txt')),
-            'summaries': self._read_file(os.path.join(project_path, 'summaries.txt')),
-            'buffer_backup': self._read_file(os.path.join(project_path, 'buffer_backup.txt'))
+            'path': project_path
         }
+        for key, filepath in paths.items():
+            self.current_project[key] = self._read_file(filepath)
         
         # Log the project load
         log_entry = f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - Project loaded into session\n"
@@ -5373,21 +5568,28 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         
         self._write_app_log(f"Project loaded successfully: {project_name} - session persistence enabled")
         return self.current_project
-        return self.current_project
     
     def _save_progress(self, stage, status):
         """Save progress tracking to project. Stages: synopsis, outline, characters, world."""
         if not self.current_project:
             return
         
-        progress_file = os.path.join(self.current_project['path'], 'progress.json')
+        project_path = self.current_project['path']
+        progress_file = os.path.join(project_path, 'progress.json')
         
-        # Load existing progress or create new
-        try:
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                progress = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            progress = {}
+        # The cached dict is authoritative once loaded - only read the file on a cold cache
+        cached = self._progress_cache.get(project_path)
+        if cached:
+            progress = cached[1]
+        elif 'progress' in self.current_project:
+            # Already loaded (or found missing) with the project - no need to reopen the file
+            progress = self.current_project['progress']
+        else:
+            try:
+                with open(progress_file, 'rb') as f:
+                    progress = _json_loads(f.read())
+            except (FileNotFoundError, json.JSONDecodeError):
+                progress = {}
         
         # Update stage status
         progress[stage] = {
@@ -5395,10 +5597,16 @@ SectionsPerChapter: {self.sections_spinbox.value()}
             'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # Save progress file
+        self.current_project['progress'] = progress
+        
+        # Save progress file atomically (write temp file, then rename over the original)
         try:
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress, f, indent=2, ensure_ascii=False)
+            tmp_file = progress_file + '.tmp'
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(progress))
+            os.replace(tmp_file, progress_file)
+            self._progress_cache[project_path] = (os.stat(progress_file).st_mtime_ns, progress)
         except Exception as e:
             self.log_update.emit(f"Warning: Could not save progress: {str(e)}")
     
@@ -5410,11 +5618,17 @@ SectionsPerChapter: {self.sections_spinbox.value()}
         progress_file = os.path.join(self.current_project['path'], 'progress.json')
         
         try:
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                progress = json.load(f)
-                # Store in current_project for quick access
-                self.current_project['progress'] = progress
-                return progress
+            mtime_ns = os.stat(progress_file).st_mtime_ns
+            cached = self._progress_cache.get(self.current_project['path'])
+            if cached and cached[0] == mtime_ns:
+                progress = cached[1]
+            else:
+                with open(progress_file, 'rb') as f:
+                    progress = _json_loads(f.read())
+                self._progress_cache[self.current_project['path']] = (mtime_ns, progress)
+            # Store in current_project for quick access
+            self.current_project['progress'] = progress
+            return progress
         except (FileNotFoundError, json.JSONDecodeError):
             self.current_project['progress'] = {}
             return {}
@@ -5605,9 +5819,9 @@ SectionsPerChapter: {self.sections_spinbox.value()}
             
             # Parse existing config to preserve other settings
             config_dict = {}
-            for line in config_content.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
+            for line in config_content.splitlines():
+                key, sep, value = line.partition(':')
+                if sep:
                     config_dict[key.strip()] = value.strip()
             
             # Update chapter tracking fields
@@ -5634,22 +5848,41 @@ SectionsPerChapter: {self.sections_spinbox.value()}
     def get_project_list(self):
         """Get list of all existing projects."""
         projects_dir = 'projects'
-        if not os.path.exists(projects_dir):
+        try:
+            # DirEntry.is_dir() uses the dirent type - no stat per project
+            with os.scandir(projects_dir) as entries:
+                return sorted(entry.name for entry in entries if entry.is_dir())
+        except FileNotFoundError:
             return []
-        
-        projects = []
-        for item in os.listdir(projects_dir):
-            item_path = os.path.join(projects_dir, item)
-            if os.path.isdir(item_path):
-                projects.append(item)
-        
-        return sorted(projects)
+    
+    def _read_file_bytes(self, filepath):
+        """Read raw file bytes, sizing the first read from stat."""
+        st = os.stat(filepath)
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            # Ask for one byte more than stat reported: a short read means EOF, so an
+            # unchanged file costs one read() call; a file that grew keeps being read
+            want = st.st_size + 1
+            parts = []
+            while True:
+                chunk = os.read(fd, want)
+                if chunk:
+                    parts.append(chunk)
+                if len(chunk) < want:
+                    break
+                want = 65536
+        finally:
+            os.close(fd)
+        return b''.join(parts)
     
     def _read_file(self, filepath):
         """Read file content safely."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read()
+            text = self._read_file_bytes(filepath).decode('utf-8')
+            # Match text-mode universal newlines
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
         except Exception as e:
             return f"Error reading file: {str(e)}"
     
@@ -5750,7 +5983,7 @@ def export_story_to_docx(project_path: str, output_filename: Optional[str] = Non
             with open(config_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.startswith('Idea:'):
-                        title = line.split(':', 1)[1].strip()
+                        title = line.partition(':')[2].strip()
                         break
         
         # Create Word document
@@ -5833,7 +6066,7 @@ def export_story_to_pdf(project_path: str, output_filename: Optional[str] = None
             with open(config_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.startswith('Idea:'):
-                        title = line.split(':', 1)[1].strip()
+                        title = line.partition(':')[2].strip()
                         break
         
         # Prepare output path